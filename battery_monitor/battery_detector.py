@@ -3,24 +3,33 @@
 Battery detector factory for creating platform-specific detectors
 """
 
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 from .utils import PlatformDetector
-from .windows_detector import WindowsBatteryDetector
-from .linux_detector import LinuxBatteryDetector
-from .macos_detector import MacOSBatteryDetector
+
+if TYPE_CHECKING:
+    from .windows_detector import WindowsBatteryDetector
+    from .linux_detector import LinuxBatteryDetector
+    from .macos_detector import MacOSBatteryDetector
 
 
 class BatteryDetectorFactory:
     """Factory for creating appropriate battery detector based on platform."""
-    
+
     @staticmethod
-    def create_detector(platform: PlatformDetector) -> Optional[Union[WindowsBatteryDetector, LinuxBatteryDetector, MacOSBatteryDetector]]:
-        """Create appropriate battery detector based on platform."""
+    def create_detector(platform: PlatformDetector) -> Optional[Union["WindowsBatteryDetector", "LinuxBatteryDetector", "MacOSBatteryDetector"]]:
+        """Create appropriate battery detector based on platform.
+
+        The detector modules are imported lazily so startup only pays for the
+        platform (and its dependencies, e.g. WMI) actually in use.
+        """
         if platform.is_windows():
+            from .windows_detector import WindowsBatteryDetector
             return WindowsBatteryDetector(platform)
         elif platform.is_linux():
+            from .linux_detector import LinuxBatteryDetector
             return LinuxBatteryDetector()
         elif platform.is_macos():
+            from .macos_detector import MacOSBatteryDetector
             return MacOSBatteryDetector()
         else:
             print(f"Unsupported platform: {platform.platform}")
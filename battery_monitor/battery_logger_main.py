@@ -5,8 +5,9 @@ Main battery logging class that coordinates all components
 
 import time
 import csv
+import queue
+import threading
 import psutil
-from datetime import datetime
 from typing import Optional
 from .config import LOG_FILE, LOG_INTERVAL, CSV_HEADERS
 from .utils import PlatformDetector, SystemUtilities
@@ -14,9 +15,57 @@ from .battery_detector import BatteryDetectorFactory
 from .system_metrics import SystemMetrics
 
 
+# Flush the CSV stream only every N rows; block buffering batches the rest
+FLUSH_EVERY_N_ROWS = 10
+
+
+# Shared result for systems without a battery (desktops, CI, ...) so the
+# no-battery path allocates nothing per tick
+_NO_BATTERY_INFO = {
+    'battery': None,
+    'percent': None,
+    'time_left': "N/A",
+    'plugged': None
+}
+
+
+# Battery-specific fields reported while no detector data is available yet
+_DEFAULT_BATTERY_DATA = {
+    'health': None,
+    'voltage': None,
+    'power_draw': None,
+    'load_severity': "Unknown",
+    'voltage_status': "Unknown",
+    'cycle_count': None
+}
+
+
+def _format_field(value):
+    """Pre-format one CSV field as a string.
+
+    None becomes an empty field (read back as NaN), floats are rendered with
+    two decimals, everything else goes through str(). Doing this once here
+    leaves no per-field type dispatch for the writer thread.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def _na_to_none(value):
+    """Map the detectors' "N/A" sentinel to None.
+
+    csv.writer emits None as an empty field, which pandas reads back as NaN,
+    keeping the numeric columns typed instead of falling back to object dtype.
+    """
+    return None if value == "N/A" else value
+
+
 class BatteryLogger:
     """Main battery logging class that coordinates all components."""
-    
+
     def __init__(self, log_file: str = LOG_FILE, log_interval: int = LOG_INTERVAL):
         self.log_file = log_file
         self.log_interval = log_interval
@@ -24,6 +73,25 @@ class BatteryLogger:
         self.system_metrics = SystemMetrics(self.platform)
         self.battery_detector = BatteryDetectorFactory.create_detector(self.platform)
         self._last_net_bytes = self.system_metrics.get_network_stats()
+        self._tick_cache = {}  # Per-tick memoization of battery syscalls
+        self._rows_since_flush = 0
+        self._start_monotonic = time.monotonic()  # Immune to wall-clock jumps
+        self._row_q = queue.Queue(maxsize=1024)  # Finished rows awaiting disk
+
+        # Resolve the optional detector capabilities once; call sites then do
+        # a single attribute read instead of a hasattr probe every refresh
+        self._get_battery_temp = getattr(self.battery_detector, 'get_battery_temperature', None)
+        self._get_voltage_power = getattr(self.battery_detector, 'get_voltage_and_power', None)
+
+        # The platform detectors can shell out (PowerShell / ioreg / sensors)
+        # and block for seconds; a background thread refreshes their values and
+        # the logging loop only ever reads the latest published snapshot
+        self._slow_lock = threading.Lock()
+        self._slow_cache = {
+            'battery_temp': None,
+            'battery_data': dict(_DEFAULT_BATTERY_DATA)
+        }
+        threading.Thread(target=self._slow_metrics_loop, daemon=True).start()
     
     def _write_csv_header(self):
         """Write CSV header if file is new."""
@@ -43,134 +111,247 @@ class BatteryLogger:
     
     def log_battery(self):
         """Main logging loop."""
-        start_time = time.time()
-        
         self._print_initial_info()
         self._write_csv_header()
         
-        with open(self.log_file, "a", newline="") as f:
+        # Disk writes happen on a background thread so a slow disk never
+        # stalls the next metric collection
+        writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        writer_thread.start()
+
+        next_deadline = time.monotonic()
+
+        while True:
+            try:
+                self._log_single_entry()
+            except KeyboardInterrupt:
+                print("\nBattery logging stopped by user.")
+                break
+            except Exception as e:
+                print(f"Error in logging loop: {e}")
+
+            # Schedule against fixed deadlines so the effective period stays
+            # log_interval instead of work_time + log_interval (no drift)
+            next_deadline += self.log_interval
+            delay = next_deadline - time.monotonic()
+            if delay <= 0:
+                # Fell behind (slow tick); realign instead of burst-catchup
+                next_deadline = time.monotonic()
+                delay = 0
+
+            try:
+                time.sleep(delay)
+            except KeyboardInterrupt:
+                print("\nBattery logging stopped by user.")
+                break
+
+        # Drain any queued rows before exiting so nothing logged is lost
+        try:
+            self._row_q.put_nowait(None)
+        except queue.Full:
+            pass  # Writer is wedged; the bounded join below exits anyway
+        writer_thread.join(timeout=5)
+
+    def _writer_loop(self):
+        """Drain queued rows to the CSV file, off the collection thread."""
+        try:
+            f = open(self.log_file, "a", newline="")
+        except OSError as e:
+            # Without a file there is nothing to write; keep consuming so
+            # queued rows do not pile up until the process exits
+            print(f"Error opening log file: {e}")
+            while self._row_q.get() is not None:
+                pass
+            return
+
+        with f:
             writer = csv.writer(f)
-            
+
             while True:
+                row = self._row_q.get()
+                if row is None:  # Shutdown sentinel
+                    break
+
+                # Drain whatever else is already queued so backed-up rows hit
+                # the stream as a single writerows call instead of one write
+                # per row
+                batch = [row]
+                shutdown = False
+                while len(batch) < FLUSH_EVERY_N_ROWS:
+                    try:
+                        row = self._row_q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if row is None:
+                        shutdown = True
+                        break
+                    batch.append(row)
+
                 try:
-                    self._log_single_entry(writer, f, start_time)
-                    time.sleep(self.log_interval)
-                    
-                except KeyboardInterrupt:
-                    print("\nBattery logging stopped by user.")
+                    writer.writerows(batch)
+
+                    # Rely on block buffering instead of forcing a write
+                    # syscall per batch; flush periodically so a crash loses
+                    # at most a few entries
+                    self._rows_since_flush += len(batch)
+                    if self._rows_since_flush >= FLUSH_EVERY_N_ROWS:
+                        f.flush()
+                        self._rows_since_flush = 0
+                except OSError as e:
+                    # Disk full is this logger's designed-in eventual
+                    # failure; report, drop the batch and keep consuming so
+                    # the writer never dies with the queue backed up
+                    print(f"Error writing to log file: {e}")
+
+                if shutdown:
                     break
-                except Exception as e:
-                    print(f"Error in logging loop: {e}")
-                    time.sleep(self.log_interval)
     
-    def _log_single_entry(self, writer, f, start_time: float):
-        """Log a single entry to the CSV file."""
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        runtime = time.time() - start_time
+    def _log_single_entry(self):
+        """Collect one entry and hand it to the background writer."""
+        self._tick_cache = {}  # Fresh battery snapshot for this tick
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        runtime = time.monotonic() - self._start_monotonic
         runtime_str = SystemUtilities.format_secs(int(runtime))
         
         # Get basic battery info
         battery_info = self._get_battery_info()
-        
-        # Get system metrics
-        system_stats = self.system_metrics.get_system_stats()
-        brightness = self.system_metrics.get_brightness()
-        
+
+        # Collect the independent system metrics concurrently; the tick then
+        # costs only the slowest collector instead of their sum
+        metrics = self.system_metrics.gather_all()
+        system_stats = metrics['system_stats']
+        brightness = metrics['brightness']
+        top_proc_str = metrics['top_processes']
+
         # Get network activity
-        net_activity_mb = self._get_network_activity()
-        
+        net_activity_mb = self._get_network_activity(metrics['network_bytes'])
+
         # Get temperature data
-        temperature_data = self._get_temperature_data()
-        
+        temperature_data = self._get_temperature_data(metrics['cpu_temperature'])
+
         # Get battery-specific data
         battery_data = self._get_battery_specific_data()
         
         # Get charging info
         charge_time_min, charge_status = self.system_metrics.get_charging_info(battery_info['battery'])
         
-        # Get top processes
-        top_proc_str = self.system_metrics.get_top_processes()
-        
         # Calculate battery drain rate (placeholder - would need historical data)
-        battery_drain_rate = "N/A"  # This would require tracking over time
+        battery_drain_rate = None  # This would require tracking over time
+        charge_time_min = _na_to_none(charge_time_min)
         
-        # Write to CSV
-        csv_row = [
+        # Pre-format the row; csv.writer still handles quoting (process names
+        # in top_proc_str may contain delimiters)
+        csv_row = tuple(_format_field(value) for value in (
             now, battery_info['percent'], battery_info['time_left'], battery_info['plugged'], runtime_str,
             system_stats['cpu_percent'], system_stats['ram_percent'], system_stats['disk_percent'], brightness,
-            net_activity_mb, temperature_data['battery_temp'], temperature_data['system_temp'], 
-            charge_time_min, charge_status, battery_data['power_draw'], battery_drain_rate, 
-            battery_data['health'], battery_data['voltage'], battery_data['load_severity'], 
+            net_activity_mb, temperature_data['battery_temp'], temperature_data['system_temp'],
+            charge_time_min, charge_status, battery_data['power_draw'], battery_drain_rate,
+            battery_data['health'], battery_data['voltage'], battery_data['load_severity'],
             battery_data['voltage_status'], battery_data['cycle_count'], top_proc_str
-        ]
-        
-        writer.writerow(csv_row)
-        f.flush()
-        
+        ))
+
+        try:
+            self._row_q.put_nowait(csv_row)
+        except queue.Full:
+            # The writer is stalled or dead; dropping this row beats
+            # blocking the collection loop behind it forever
+            print("Warning: log writer backed up; dropping one row")
+
         # Print status
         self._print_status(now, battery_info, battery_data, temperature_data, system_stats)
     
+    def _cached_battery(self):
+        """Get the psutil battery object, memoized for the current tick.
+
+        All helpers that run within one tick see the same snapshot, so the
+        underlying power-status syscall happens at most once per log interval.
+        """
+        if 'battery' not in self._tick_cache:
+            self._tick_cache['battery'] = psutil.sensors_battery()
+        return self._tick_cache['battery']
+
     def _get_battery_info(self) -> dict:
         """Get basic battery information from psutil."""
-        battery = psutil.sensors_battery()
+        battery = self._cached_battery()
+        if battery is None:
+            return _NO_BATTERY_INFO
         return {
             'battery': battery,
-            'percent': battery.percent if battery else "N/A",
-            'time_left': SystemUtilities.format_secs(battery.secsleft if battery else None),
-            'plugged': battery.power_plugged if battery else "N/A"
+            'percent': battery.percent,
+            'time_left': SystemUtilities.format_secs(battery.secsleft),
+            'plugged': battery.power_plugged
         }
     
-    def _get_network_activity(self) -> float:
+    def _get_network_activity(self, current_net_bytes=None) -> float:
         """Get network activity since last measurement."""
-        current_net_bytes = self.system_metrics.get_network_stats()
+        if current_net_bytes is None:
+            current_net_bytes = self.system_metrics.get_network_stats()
         net_activity = current_net_bytes - self._last_net_bytes
         self._last_net_bytes = current_net_bytes
         return round(net_activity / (1024*1024), 2)
     
-    def _get_temperature_data(self) -> dict:
+    def _slow_metrics_loop(self):
+        """Periodically refresh expensive detector metrics off the log loop."""
+        while True:
+            battery_temperature = None
+            if self._get_battery_temp:
+                battery_temperature = _na_to_none(self._get_battery_temp())
+
+            battery_data = self._collect_battery_specific_data()
+
+            with self._slow_lock:
+                self._slow_cache['battery_temp'] = battery_temperature
+                self._slow_cache['battery_data'] = battery_data
+
+            time.sleep(self.log_interval)
+
+    def _get_temperature_data(self, cpu_temperature=None) -> dict:
         """Get temperature data from various sources."""
-        system_temperature = self.system_metrics.get_cpu_temperature()
-        battery_temperature = "N/A"
-        
-        if self.battery_detector and hasattr(self.battery_detector, 'get_battery_temperature'):
-            battery_temperature = self.battery_detector.get_battery_temperature()
-        
+        if cpu_temperature is None:
+            cpu_temperature = self.system_metrics.get_cpu_temperature()
+        system_temperature = _na_to_none(cpu_temperature)
+
+        with self._slow_lock:
+            battery_temperature = self._slow_cache['battery_temp']
+
         return {
             'battery_temp': battery_temperature,
             'system_temp': system_temperature,
-            'display_temp': battery_temperature if battery_temperature != "N/A" else system_temperature
+            'display_temp': battery_temperature if battery_temperature is not None else system_temperature
         }
-    
+
     def _get_battery_specific_data(self) -> dict:
-        """Get battery-specific data like voltage, power, health, etc."""
-        default_data = {
-            'health': "N/A",
-            'voltage': "N/A",
-            'power_draw': "N/A",
-            'load_severity': "Unknown",
-            'voltage_status': "Unknown",
-            'cycle_count': "N/A"
-        }
-        
+        """Get the latest battery-specific data published by the slow thread."""
+        with self._slow_lock:
+            return dict(self._slow_cache['battery_data'])
+
+    def _collect_battery_specific_data(self) -> dict:
+        """Collect battery-specific data like voltage, power, health, etc."""
+        default_data = dict(_DEFAULT_BATTERY_DATA)
+
         if not self.battery_detector:
             return default_data
-        
+
         try:
-            # Get detailed battery info (cached from initial call for performance)
-            battery_details = self.battery_detector.get_battery_details()
+            # Get detailed battery info (cached from initial call for
+            # performance). The Windows detector accepts the psutil snapshot
+            # so it does not have to issue its own power-status WMI call.
+            if self.platform.is_windows():
+                battery_details = self.battery_detector.get_battery_details(
+                    battery=psutil.sensors_battery())
+            else:
+                battery_details = self.battery_detector.get_battery_details()
             
             # Get voltage and power info
-            voltage_power = {}
-            if hasattr(self.battery_detector, 'get_voltage_and_power'):
-                voltage_power = self.battery_detector.get_voltage_and_power()
+            voltage_power = self._get_voltage_power() if self._get_voltage_power else {}
             
             return {
-                'health': battery_details.get('health', "N/A"),
-                'voltage': voltage_power.get('voltage', "N/A"),
-                'power_draw': voltage_power.get('power_draw', "N/A"),
+                'health': _na_to_none(battery_details.get('health')),
+                'voltage': _na_to_none(voltage_power.get('voltage')),
+                'power_draw': _na_to_none(voltage_power.get('power_draw')),
                 'load_severity': voltage_power.get('load_severity', "Unknown"),
                 'voltage_status': voltage_power.get('voltage_status', "Unknown"),
-                'cycle_count': battery_details.get('cycle_count', "N/A")
+                'cycle_count': _na_to_none(battery_details.get('cycle_count'))
             }
         except Exception as e:
             print(f"Error getting battery-specific data: {e}")
@@ -180,17 +361,20 @@ class BatteryLogger:
                      temperature_data: dict, system_stats: dict):
         """Print current status to console."""
         status = "Plugged" if battery_info['plugged'] else "On Battery"
-        print(f"{timestamp} | {battery_info['percent']}% | {status} | {temperature_data['display_temp']}°C")
+        percent = battery_info['percent'] if battery_info['percent'] is not None else "N/A"
+        temp = temperature_data['display_temp'] if temperature_data['display_temp'] is not None else "N/A"
+        print(f"{timestamp} | {percent}% | {status} | {temp}°C")
     
     def get_single_battery_snapshot(self) -> dict:
         """Get a single snapshot of battery data without logging."""
+        self._tick_cache = {}  # Fresh battery snapshot for this call
         battery_info = self._get_battery_info()
         system_stats = self.system_metrics.get_system_stats()
         temperature_data = self._get_temperature_data()
         battery_data = self._get_battery_specific_data()
         
         return {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
             'battery_info': battery_info,
             'system_stats': system_stats,
             'temperature_data': temperature_data,
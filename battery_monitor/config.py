@@ -11,6 +11,10 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 USER_SETTINGS_FILE = PROJECT_ROOT / "user_settings.json"
 
+# Cache of the parsed settings file, keyed on its modification time so
+# repeated reads (e.g. from UI refresh loops) skip the open+parse entirely
+_settings_cache = {'mtime': 0, 'data': None}
+
 def load_user_settings():
     """Load user settings from JSON file, create with defaults if not exists"""
     default_settings = {
@@ -27,6 +31,9 @@ def load_user_settings():
     
     try:
         if USER_SETTINGS_FILE.exists():
+            mtime = os.stat(USER_SETTINGS_FILE).st_mtime_ns
+            if mtime == _settings_cache['mtime'] and _settings_cache['data'] is not None:
+                return _settings_cache['data']
             with open(USER_SETTINGS_FILE, 'r') as f:
                 settings = json.load(f)
                 # Merge with defaults to ensure all keys exist
@@ -37,6 +44,8 @@ def load_user_settings():
                         for subkey in default_settings[key]:
                             if subkey not in settings[key]:
                                 settings[key][subkey] = default_settings[key][subkey]
+                _settings_cache['mtime'] = mtime
+                _settings_cache['data'] = settings
                 return settings
         else:
             # Create default settings file
@@ -51,6 +60,9 @@ def save_user_settings(settings):
     try:
         with open(USER_SETTINGS_FILE, 'w') as f:
             json.dump(settings, f, indent=4)
+        # Keep the cache in sync with what was just written
+        _settings_cache['mtime'] = os.stat(USER_SETTINGS_FILE).st_mtime_ns
+        _settings_cache['data'] = settings
     except Exception as e:
         print(f"Warning: Failed to save user settings: {e}")
 
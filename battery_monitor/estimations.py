@@ -1,7 +1,113 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
-def estimate_time_left_data_based(data):
+# Maximum gap between data points to consider logging continuous
+MAX_GAP_MINUTES = 5
+
+# Incremental cache for _detect_battery_intervals. The battery log is
+# append-only, so intervals detected over an unchanged prefix can be reused
+# and only the tail that may still change gets rescanned on the next call.
+_interval_cache = {
+    'n': 0,
+    'last_ts': None,
+    'on_battery_count': 0,
+    'intervals': []
+}
+
+
+def _ensure_datetime(data):
+    """Convert the timestamp column to datetime64 once per DataFrame.
+
+    A marker in data.attrs skips even the dtype check on repeat calls, so
+    the O(N) string parse happens at most once for logs not already parsed
+    at CSV ingest.
+    """
+    if data.attrs.get('_ts_converted'):
+        return
+    if not pd.api.types.is_datetime64_any_dtype(data['timestamp']):
+        data['timestamp'] = pd.to_datetime(data['timestamp'])
+    data.attrs['_ts_converted'] = True
+
+
+def _scan_intervals(plugged, ts, offset=0):
+    """Run the vectorized continuity scan over (slices of) the log arrays.
+
+    A pair of consecutive samples belongs to a battery interval when both are
+    on battery and the time gap between them is small enough. Runs of such
+    pairs are found via boolean edge detection; pair index k covers rows
+    (k, k+1), so a run of pairs [s, e) spans rows s..e.
+
+    Returns:
+        list: (start_idx, end_idx) row-index tuples, shifted by offset
+    """
+    if plugged.size < 2:
+        return []
+
+    gaps = np.diff(ts) / np.timedelta64(60, 's')
+    continuous = (~plugged[1:]) & (~plugged[:-1]) & (gaps <= MAX_GAP_MINUTES)
+
+    edges = np.diff(np.r_[np.int8(0), continuous.view(np.int8), np.int8(0)])
+    starts = np.flatnonzero(edges == 1) + offset
+    ends = np.flatnonzero(edges == -1) + offset
+
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def _detect_battery_intervals(data):
+    """
+    Detect discrete on-battery intervals, rescanning only newly appended rows.
+
+    Closed intervals in the already-seen prefix cannot change when rows are
+    appended, so when the cached prefix still matches (same row count marker,
+    same boundary timestamp, same on-battery count) only the last open
+    interval and the new tail are rescanned — O(new rows) instead of O(all).
+
+    Returns:
+        list: (start_idx, end_idx) tuples of row indices
+    """
+    plugged = data['power_plugged'].to_numpy(dtype=bool)
+    ts = data['timestamp'].to_numpy()
+    n = plugged.size
+
+    if n == 0:
+        return []
+
+    cache = _interval_cache
+    last_ts = ts[-1]
+
+    if (cache['n'] == n and cache['last_ts'] == last_ts
+            and cache['on_battery_count'] == int((~plugged).sum())):
+        return cache['intervals']
+
+    prefix_matches = (
+        0 < cache['n'] < n
+        and cache['last_ts'] == ts[cache['n'] - 1]
+        and cache['on_battery_count'] == int((~plugged[:cache['n']]).sum())
+    )
+
+    if prefix_matches:
+        previous = cache['intervals']
+        if previous and previous[-1][1] == cache['n'] - 1:
+            # The last cached interval was still open at the tail; it may have
+            # been extended by the appended rows, so rescan from its start
+            rescan_from = previous[-1][0]
+            intervals = previous[:-1]
+        else:
+            rescan_from = cache['n'] - 1
+            intervals = list(previous)
+        intervals = intervals + _scan_intervals(
+            plugged[rescan_from:], ts[rescan_from:], rescan_from)
+    else:
+        intervals = _scan_intervals(plugged, ts)
+
+    cache['n'] = n
+    cache['last_ts'] = last_ts
+    cache['on_battery_count'] = int((~plugged).sum())
+    cache['intervals'] = intervals
+    return intervals
+
+def estimate_time_left_data_based(data, drain_stats=None, current_percent=None):
     """
     Estimate the remaining time left on battery based on historical data from the battery_log.csv file.
 
@@ -16,7 +122,7 @@ def estimate_time_left_data_based(data):
         dict: Contains 'time_left_minutes', 'confidence', 'intervals_used', 'average_drain_rate'
     """
 
-    result = get_weighted_average_drain_rate(data)
+    result = drain_stats if drain_stats is not None else get_weighted_average_drain_rate(data)
     if result is None:
         return {
             'time_left_minutes': None,
@@ -27,7 +133,11 @@ def estimate_time_left_data_based(data):
         }
     
     average_drain_rate, confidence, intervals_used, interval_details = result
-    current_battery_percent = data['percentage'].iloc[-1]  # read latest battery percentage from data in battery_log.csv
+    if current_percent is None:
+        current_percent = data['percentage'].iat[-1]  # read latest battery percentage from data in battery_log.csv
+    # float() so the float32 column cannot leak NumPy scalars into the
+    # JSON payload
+    current_battery_percent = float(current_percent)
     
     if average_drain_rate is not None and average_drain_rate > 0:
         time_left = current_battery_percent / average_drain_rate  # in minutes
@@ -47,129 +157,114 @@ def estimate_time_left_data_based(data):
         'interval_details': interval_details
     }
 
-def get_weighted_average_drain_rate(data):
+def get_weighted_average_drain_rate(data, include_details=True):
     """
     Calculate a weighted average drain rate (% per minute) from historical battery data.
 
     This function identifies discrete intervals in the data where the system was running on battery power
     without interruptions. It calculates the drain rate for each interval and then computes a weighted
     average, giving more importance to longer intervals and more recent data.
+    Callers that only need the numeric estimate can pass include_details=False
+    to skip assembling the per-interval payload for the frontend.
     
     Returns:
         tuple: (average_drain_rate, confidence_score, num_intervals) or None if no valid intervals
     """
-    # Convert timestamp to datetime if it's not already
-    if not pd.api.types.is_datetime64_any_dtype(data['timestamp']):
-        data['timestamp'] = pd.to_datetime(data['timestamp'])
-    
-    intervals = []
-    start_idx = None
-    max_gap_minutes = 5  # Maximum gap between data points to consider continuous
-
-    for i in range(1, len(data)):
-        current_plugged = data['power_plugged'].iloc[i]
-        prev_plugged = data['power_plugged'].iloc[i-1]
-        
-        # Check for time gap (data interruption)
-        time_gap = (data['timestamp'].iloc[i] - data['timestamp'].iloc[i-1]).total_seconds() / 60
-        
-        if current_plugged == False and prev_plugged == False and time_gap <= max_gap_minutes:
-            if start_idx is None:
-                start_idx = i - 1
-        else:
-            if start_idx is not None:
-                end_idx = i - 1
-                if end_idx > start_idx:
-                    intervals.append((start_idx, end_idx))
-                start_idx = None
+    # Cheap prefilter: a fully plugged-in history (the common "laptop on AC
+    # all day" case) or one too short to hold an interval can never produce
+    # valid drain rates, so skip the scan entirely
+    plugged = data['power_plugged'].to_numpy(dtype=bool)
+    if plugged.size < 3 or plugged.all():
+        return None
 
-    # Handle case where data ends while on battery
-    if start_idx is not None and start_idx < len(data) - 1:
-        intervals.append((start_idx, len(data) - 1))
+    ts = data['timestamp'].to_numpy()
+    # float32 carries battery percentages exactly enough (0-100, two
+    # decimals) and halves the memory traffic of the hot arrays
+    pct = data['percentage'].to_numpy(dtype=np.float32)
 
+    intervals = _detect_battery_intervals(data)
     if not intervals:
         return None
 
-    drain_rates = []
-    weights = []
-    durations = []
-    recent_weight_multiplier = []
-
     # Use only the last 10 intervals for more recent/relevant data
-    recent_intervals = intervals[-10:] if len(intervals) > 10 else intervals
-    total_intervals = len(recent_intervals)
-    
-    for i, (start, end) in enumerate(recent_intervals):
-        start_percent = data['percentage'].iloc[start]
-        end_percent = data['percentage'].iloc[end]
-        start_time = data['timestamp'].iloc[start]
-        end_time = data['timestamp'].iloc[end]
-        time_diff = (end_time - start_time).total_seconds() / 60  # in minutes
-
-        # Only consider intervals with meaningful duration and battery drain
-        if time_diff >= 2 and start_percent > end_percent and (start_percent - end_percent) >= 0.5:
-            drain_rate = (start_percent - end_percent) / time_diff  # % per minute
-            
-            # Weight by duration (longer intervals are more reliable)
-            duration_weight = min(time_diff, 120)  # Cap at 2 hours to prevent single long intervals from dominating
-            
-            # Recent intervals get exponentially higher weight
-            recency_weight = pow(2, i)  # Exponential increase: 1, 2, 4, 8, 16...
-            
-            # Combined weight
-            combined_weight = duration_weight * recency_weight
-            
-            drain_rates.append(drain_rate)
-            weights.append(combined_weight)
-            durations.append(time_diff)
-            recent_weight_multiplier.append(recency_weight)
-
-    if not drain_rates:
+    recent = np.asarray(intervals[-10:], dtype=np.intp)
+    start_idx = recent[:, 0]
+    end_idx = recent[:, 1]
+
+    start_pct = pct[start_idx]
+    end_pct = pct[end_idx]
+    time_diffs = (ts[end_idx] - ts[start_idx]) / np.timedelta64(60, 's')  # in minutes
+
+    # Only consider intervals with meaningful duration and battery drain
+    valid = (time_diffs >= 2) & ((start_pct - end_pct) >= 0.5)
+
+    drain_rates = (start_pct[valid] - end_pct[valid]) / time_diffs[valid]  # % per minute
+    durations = time_diffs[valid]
+
+    # Weight by duration (longer intervals are more reliable), capped at 2 hours
+    # to prevent single long intervals from dominating
+    duration_weights = np.minimum(durations, 120)
+
+    # Recent intervals get exponentially higher weight: 1, 2, 4, 8, 16...
+    # (integer bitshift, cast once; exact for the at most 10 values here)
+    recency_weights = (1 << np.arange(recent.shape[0])).astype(np.float64)[valid]
+
+    weights = duration_weights * recency_weights
+
+    if drain_rates.size == 0:
         return None
 
-    # Calculate weighted average
-    weighted_average = sum(rate * weight for rate, weight in zip(drain_rates, weights)) / sum(weights)
-    
-    # Prepare interval details for frontend
+    # Calculate weighted average in one vector pass
+    weighted_average = float(np.dot(drain_rates, weights) / weights.sum())
+
+    # Prepare interval details for frontend; the ISO strings come from one
+    # vectorized datetime_as_string call instead of per-row .isoformat()
     interval_details = []
-    for i, (start, end) in enumerate(recent_intervals):
-        if i < len(drain_rates):  # Only include intervals that were actually used
+    if include_details:
+        valid_starts = start_idx[valid]
+        valid_ends = end_idx[valid]
+        start_iso = np.datetime_as_string(ts[valid_starts], unit='s')
+        end_iso = np.datetime_as_string(ts[valid_ends], unit='s')
+        for i in range(drain_rates.size):
+            start = int(valid_starts[i])
+            end = int(valid_ends[i])
             interval_details.append({
-                'start_time': data['timestamp'].iloc[start].isoformat(),
-                'end_time': data['timestamp'].iloc[end].isoformat(),
-                'duration_minutes': durations[i],
+                'start_time': start_iso[i],
+                'end_time': end_iso[i],
+                'duration_minutes': float(durations[i]),
                 'data_points': end - start + 1,
-                'start_percentage': float(data['percentage'].iloc[start]),
-                'end_percentage': float(data['percentage'].iloc[end]),
-                'drain_rate': drain_rates[i],
-                'weight': weights[i]
+                'start_percentage': float(pct[start]),
+                'end_percentage': float(pct[end]),
+                'drain_rate': float(drain_rates[i]),
+                'weight': float(weights[i])
             })
-    
+
     # Calculate confidence score based on:
     # 1. Number of intervals
     # 2. Total duration of data
     # 3. Consistency of drain rates (lower variance = higher confidence)
-    total_duration = sum(durations)
-    num_intervals = len(drain_rates)
-    
+    total_duration = float(durations.sum())
+    num_intervals = int(drain_rates.size)
+
     # Variance in drain rates (normalized)
-    if len(drain_rates) > 1:
-        variance = sum((rate - weighted_average) ** 2 for rate in drain_rates) / len(drain_rates)
+    if num_intervals > 1:
+        variance = float(np.mean((drain_rates - weighted_average) ** 2))
         normalized_variance = min(variance / weighted_average, 1.0) if weighted_average > 0 else 1.0
     else:
         normalized_variance = 0.5  # Moderate confidence for single interval
     
-    # Confidence factors
-    interval_confidence = min(num_intervals / 5.0, 1.0)  # Max confidence at 5+ intervals
-    duration_confidence = min(total_duration / 60.0, 1.0)  # Max confidence at 60+ minutes
-    consistency_confidence = 1.0 - normalized_variance  # Higher consistency = higher confidence
-    
+    # Confidence factors (intervals max out at 5+, duration at 60+ minutes,
+    # consistency at zero variance), clamped to 0-1 in one branchless pass
+    factors = np.clip(
+        np.array([num_intervals / 5.0, total_duration / 60.0, 1.0 - normalized_variance]),
+        0.0, 1.0)
+
     # Overall confidence (0-1 scale)
-    confidence = (interval_confidence * 0.4 + duration_confidence * 0.3 + consistency_confidence * 0.3)
+    confidence = float(np.dot(factors, [0.4, 0.3, 0.3]))
     
     return weighted_average, confidence, num_intervals, interval_details
 
-def estimate_time_on_full_battery(data):
+def estimate_time_on_full_battery(data, drain_stats=None):
     """
     Estimate the total time the battery can last on a full charge based on historical data.
 
@@ -179,7 +274,7 @@ def estimate_time_on_full_battery(data):
     Returns:
         dict: Contains 'full_battery_time_minutes', 'confidence', 'intervals_used', 'average_drain_rate'
     """
-    result = get_weighted_average_drain_rate(data)
+    result = drain_stats if drain_stats is not None else get_weighted_average_drain_rate(data)
     if result is None:
         return {
             'full_battery_time_minutes': None,
@@ -217,50 +312,32 @@ def estimate_time_left_last_interval(data):
     Returns:
         dict: Contains 'time_left_minutes', 'confidence', 'drain_rate' based on last interval only
     """
-    # Convert timestamp to datetime if it's not already
-    if not pd.api.types.is_datetime64_any_dtype(data['timestamp']):
-        data['timestamp'] = pd.to_datetime(data['timestamp'])
-    
+    # Cheap prefilter matching get_weighted_average_drain_rate: nothing to
+    # estimate when the history never left AC power or is too short
+    plugged = data['power_plugged'].to_numpy(dtype=bool)
+    if plugged.size < 3 or plugged.all():
+        return {
+            'time_left_minutes': None,
+            'confidence': 0,
+            'drain_rate': None,
+            'debug': 'No battery intervals found'
+        }
+
+    # Pull the columns into NumPy once; scalar ndarray indexing below avoids
+    # repeated trips through the pandas indexing machinery
+    pct = data['percentage'].to_numpy(dtype=np.float32)
+    ts = data['timestamp'].to_numpy()
+
     # Find the most recent battery interval (even if it's currently ongoing)
-    intervals = []
-    start_idx = None
-    max_gap_minutes = 5
-    
-    # First, find all battery intervals (same logic as main function)
-    for i in range(1, len(data)):
-        current_plugged = data['power_plugged'].iloc[i]
-        prev_plugged = data['power_plugged'].iloc[i-1]
-        
-        # Check for time gap (data interruption)
-        time_gap = (data['timestamp'].iloc[i] - data['timestamp'].iloc[i-1]).total_seconds() / 60
-        
-        if current_plugged == False and prev_plugged == False and time_gap <= max_gap_minutes:
-            if start_idx is None:
-                start_idx = i - 1
-        else:
-            if start_idx is not None:
-                end_idx = i - 1
-                if end_idx > start_idx:
-                    intervals.append((start_idx, end_idx))
-                start_idx = None
-
-    # Handle case where data ends while on battery
-    if start_idx is not None and start_idx < len(data) - 1:
-        intervals.append((start_idx, len(data) - 1))
-    
+    # using the shared vectorized detector
+    intervals = _detect_battery_intervals(data)
+
     # If no intervals found, try to find any recent battery usage
     if not intervals:
-        # Look for any battery usage in recent data
-        battery_indices = []
-        for i in range(len(data)):
-            if data['power_plugged'].iloc[i] == False:
-                battery_indices.append(i)
-        
-        if len(battery_indices) >= 2:
-            # Use the last few battery data points
-            start_idx = battery_indices[-min(len(battery_indices), 10)]  # Last 10 or fewer
-            end_idx = battery_indices[-1]
-            intervals = [(start_idx, end_idx)]
+        # Span the last few on-battery rows (up to 10), located in one pass
+        battery_indices = np.flatnonzero(~plugged)[-10:]
+        if battery_indices.size >= 2:
+            intervals = [(int(battery_indices[0]), int(battery_indices[-1]))]
     
     if not intervals:
         return {
@@ -270,14 +347,15 @@ def estimate_time_left_last_interval(data):
             'debug': 'No battery intervals found'
         }
     
-    # Use the last (most recent) interval
+    # Use the last (most recent) interval. Plain floats from here on, so
+    # no NumPy scalar reaches the JSON payload
     start, end = intervals[-1]
-    start_percent = data['percentage'].iloc[start]
-    end_percent = data['percentage'].iloc[end]
-    current_percent = data['percentage'].iloc[-1]
-    start_time = data['timestamp'].iloc[start]
-    end_time = data['timestamp'].iloc[end]
-    time_diff = (end_time - start_time).total_seconds() / 60  # in minutes
+    start_percent = float(pct[start])
+    end_percent = float(pct[end])
+    current_percent = float(pct[-1])
+    start_time = pd.Timestamp(ts[start])
+    end_time = pd.Timestamp(ts[end])
+    time_diff = float((ts[end] - ts[start]) / np.timedelta64(60, 's'))  # in minutes
     
     # More lenient requirements for last interval
     if time_diff >= 1 and start_percent > end_percent and (start_percent - end_percent) >= 0.1:
@@ -299,8 +377,8 @@ def estimate_time_left_last_interval(data):
                 'end_time': end_time.isoformat(),
                 'duration_minutes': time_diff,
                 'data_points': end - start + 1,
-                'start_percentage': float(start_percent),
-                'end_percentage': float(end_percent),
+                'start_percentage': start_percent,
+                'end_percentage': end_percent,
                 'drain_rate': drain_rate,
                 'weight': 1.0,
                 'is_latest': True
@@ -315,15 +393,16 @@ def estimate_time_left_last_interval(data):
         'interval_details': []
     }
 
-def estimate_full_battery_last_interval(data):
+def estimate_full_battery_last_interval(data, last_interval_result=None):
     """
     Estimate full battery time based only on the most recent battery interval.
     
     Returns:
         dict: Contains 'full_battery_time_minutes', 'confidence', 'drain_rate'
     """
-    last_interval_result = estimate_time_left_last_interval(data)
-    
+    if last_interval_result is None:
+        last_interval_result = estimate_time_left_last_interval(data)
+
     if last_interval_result['drain_rate'] is not None and last_interval_result['drain_rate'] > 0:
         full_battery_time = 100 / last_interval_result['drain_rate']  # in minutes
         return {
@@ -347,14 +426,36 @@ def get_battery_estimations(data):
     Returns:
         dict: Contains both averaged and last-interval estimations
     """
-    time_left_result = estimate_time_left_data_based(data)
-    full_battery_result = estimate_time_on_full_battery(data)
-    
-    # New: Last interval estimations
-    time_left_last = estimate_time_left_last_interval(data)
-    full_battery_last = estimate_full_battery_last_interval(data)
-    
-    current_percentage = data['percentage'].iloc[-1] if len(data) > 0 else 0
+    _ensure_datetime(data)
+
+    # Run the interval-detection + weighted-average pipeline once and share
+    # the result between both averaged estimators
+    # Read the latest row's scalars once (iat skips the iloc fallback path)
+    current_percentage = float(data['percentage'].iat[-1]) if len(data) > 0 else 0
+    last_ts = data['timestamp'].iat[-1] if len(data) > 0 else None
+
+    currently_plugged = bool(data['power_plugged'].iat[-1]) if len(data) > 0 else False
+
+    drain_stats = get_weighted_average_drain_rate(data)
+    full_battery_result = estimate_time_on_full_battery(data, drain_stats)
+
+    # New: Last interval estimations (also feed the full-battery variant so
+    # the last interval is only analyzed once)
+    last_interval_result = estimate_time_left_last_interval(data)
+    full_battery_last = estimate_full_battery_last_interval(data, last_interval_result)
+
+    if currently_plugged:
+        # A time-left countdown is meaningless while charging; flag that
+        # state instead of projecting the historical drain rate forward.
+        # The full-battery estimates above stay useful either way.
+        time_left_result = dict(estimate_time_left_data_based(data, drain_stats),
+                                time_left_minutes=None, charging=True)
+        time_left_last = dict(last_interval_result,
+                              time_left_minutes=None, charging=True)
+    else:
+        time_left_result = estimate_time_left_data_based(
+            data, drain_stats, current_percent=current_percentage)
+        time_left_last = last_interval_result
     
     return {
         'current_percentage': current_percentage,
@@ -362,5 +463,5 @@ def get_battery_estimations(data):
         'full_battery': full_battery_result,
         'time_left_last_interval': time_left_last,
         'full_battery_last_interval': full_battery_last,
-        'timestamp': data['timestamp'].iloc[-1].isoformat() if len(data) > 0 else None
+        'timestamp': last_ts.isoformat() if last_ts is not None else None
     }
\ No newline at end of file
@@ -4,14 +4,34 @@ Linux-specific battery detection using /sys filesystem
 """
 
 import os
+import logging
 import re
 from typing import Dict, Any, Optional
-from .utils import SystemUtilities
+from .utils import SystemUtilities, classify_power_metrics
+
+logger = logging.getLogger(__name__)
+
+
+# Compiled once; scans `sensors` output for a battery/ACPI temperature
+_SENSORS_TEMP_RE = re.compile(r'(Battery|ACPI|temp\d+).*?(\d+\.?\d*)\s*°C')
 
 
 class LinuxBatteryDetector:
     """Linux-specific battery detection using /sys filesystem."""
-    
+
+    # Sentinel distinguishing "never probed" from "probed, no battery found"
+    _UNRESOLVED = object()
+
+    # Sysfs attributes that never change for a given battery; their values
+    # are read once and memoized, unlike status/cycle_count which are
+    # re-read every call
+    _STATIC_FILES = ('energy_full_design', 'energy_full', 'manufacturer',
+                     'model_name', 'technology')
+
+    def __init__(self):
+        self._battery_path = self._UNRESOLVED
+        self._static_info = {}
+
     def get_battery_details(self) -> Dict[str, Any]:
         """Get battery details from Linux /sys filesystem."""
         details = {
@@ -26,7 +46,7 @@ class LinuxBatteryDetector:
             'design_voltage': "N/A"
         }
         
-        print("Getting battery details from Linux /sys filesystem...")
+        logger.debug("Getting battery details from Linux /sys filesystem...")
         battery_path = self._find_battery_path()
         
         if battery_path:
@@ -36,19 +56,31 @@ class LinuxBatteryDetector:
         return details
     
     def _find_battery_path(self) -> Optional[str]:
-        """Find the battery path in /sys/class/power_supply/."""
-        battery_path = '/sys/class/power_supply/BAT0'
-        
-        if os.path.exists(battery_path):
-            return battery_path
-        
-        # Try alternative paths
-        for i in range(5):
-            alt_path = f'/sys/class/power_supply/BAT{i}'
-            if os.path.exists(alt_path):
-                print(f"Using battery path: {alt_path}")
-                return alt_path
-        
+        """Find the battery path in /sys/class/power_supply/.
+
+        The result (including "no battery") is cached on first resolution,
+        so the periodic monitoring loop does not re-stat the candidate
+        paths on every call.
+        """
+        if self._battery_path is not self._UNRESOLVED:
+            return self._battery_path
+
+        # One directory enumeration instead of stat-probing BAT0..BAT4
+        # individually; pick the lowest-numbered battery entry
+        try:
+            entries = sorted(entry.path
+                             for entry in os.scandir('/sys/class/power_supply')
+                             if entry.name.startswith('BAT'))
+        except OSError:
+            entries = []
+
+        if entries:
+            self._battery_path = entries[0]
+            if self._battery_path != '/sys/class/power_supply/BAT0':
+                logger.debug("Using battery path: %s", self._battery_path)
+            return self._battery_path
+
+        self._battery_path = None
         return None
     
     def _extract_linux_battery_info(self, battery_path: str, details: Dict[str, Any]):
@@ -64,31 +96,39 @@ class LinuxBatteryDetector:
         }
         
         for file_name, detail_key in info_files.items():
+            # Hardware-constant attributes are served from the memoized value
+            # after the first successful read
+            if file_name in self._STATIC_FILES and file_name in self._static_info:
+                details[detail_key] = self._static_info[file_name]
+                continue
+
             file_path = os.path.join(battery_path, file_name)
             value = SystemUtilities.safe_file_read(file_path)
-            
+
             if value and value != 'Unknown':
                 # Convert numeric values appropriately
                 if detail_key in ['design_capacity', 'full_charge_capacity', 'cycle_count']:
-                    numeric_value = SystemUtilities.safe_int_conversion(value)
+                    numeric_value = SystemUtilities.fast_int(value)
                     if numeric_value is not None:
                         details[detail_key] = numeric_value
-                        print(f"{detail_key}: {numeric_value}")
+                        logger.debug("%s: %s", detail_key, numeric_value)
                 else:
                     details[detail_key] = value
-                    print(f"{detail_key}: {value}")
+                    logger.debug("%s: %s", detail_key, value)
+
+                if file_name in self._STATIC_FILES:
+                    self._static_info[file_name] = details[detail_key]
     
     def _calculate_health(self, details: Dict[str, Any]):
         """Calculate battery health from design and full capacity."""
-        if (details['design_capacity'] != "N/A" and 
-            details['full_charge_capacity'] != "N/A" and 
-            isinstance(details['design_capacity'], (int, float)) and 
-            isinstance(details['full_charge_capacity'], (int, float)) and
-            details['design_capacity'] > 0):
-            
+        try:
+            # The capacities are either ints from safe_int_conversion or the
+            # "N/A" sentinel; the division raises on anything non-numeric
             health_pct = (details['full_charge_capacity'] / details['design_capacity']) * 100
-            details['health'] = round(health_pct, 1)
-            print(f"Calculated health: {details['health']}%")
+        except (TypeError, ZeroDivisionError):
+            return
+        details['health'] = round(health_pct, 1)
+        logger.debug("Calculated health: %s%%", details['health'])
     
     def get_voltage_and_power(self) -> Dict[str, Any]:
         """Get voltage and power information from Linux."""
@@ -104,90 +144,70 @@ class LinuxBatteryDetector:
             return result
         
         try:
-            print("Getting voltage and power from Linux /sys...")
-            
+            logger.debug("Getting voltage and power from Linux /sys...")
+
+            # Enumerate every attribute this tick needs up front and fetch
+            # them in one batch over the cached descriptors
+            values = SystemUtilities.batch_read_paths([
+                os.path.join(battery_path, name)
+                for name in ('voltage_now', 'voltage_avg', 'power_now', 'current_now')
+            ])
+
             # Get voltage
-            self._get_linux_voltage(battery_path, result)
-            
+            self._get_linux_voltage(battery_path, values, result)
+
             # Get power draw
-            self._get_linux_power(battery_path, result)
-            
+            self._get_linux_power(battery_path, values, result)
+
             # Classify metrics
-            self._classify_power_metrics(result)
+            classify_power_metrics(result)
             
         except Exception as e:
-            print(f"Error getting Linux voltage/power: {e}")
+            logger.warning("Error getting Linux voltage/power: %s", e)
         
         return result
     
-    def _get_linux_voltage(self, battery_path: str, result: Dict[str, Any]):
-        """Get voltage from Linux battery path."""
+    def _get_linux_voltage(self, battery_path: str, values: Dict[str, Any], result: Dict[str, Any]):
+        """Get voltage from the batch-read Linux battery attributes."""
         voltage_files = ['voltage_now', 'voltage_avg']
         for voltage_file in voltage_files:
-            file_path = os.path.join(battery_path, voltage_file)
-            value = SystemUtilities.safe_file_read(file_path)
-            
+            value = values.get(os.path.join(battery_path, voltage_file))
+
             if value:
-                voltage_uv = SystemUtilities.safe_int_conversion(value)
+                voltage_uv = SystemUtilities.fast_int(value)
                 if voltage_uv and voltage_uv > 0:
                     voltage = round(voltage_uv / 1000000, 2)  # Convert microvolts to volts
                     result['voltage'] = voltage
-                    print(f"Linux voltage from {voltage_file}: {voltage}V")
+                    logger.debug("Linux voltage from %s: %sV", voltage_file, voltage)
                     break
     
-    def _get_linux_power(self, battery_path: str, result: Dict[str, Any]):
-        """Get power draw from Linux battery path."""
+    def _get_linux_power(self, battery_path: str, values: Dict[str, Any], result: Dict[str, Any]):
+        """Get power draw from the batch-read Linux battery attributes."""
         # Try direct power reading first
-        power_file = os.path.join(battery_path, 'power_now')
-        value = SystemUtilities.safe_file_read(power_file)
-        
+        value = values.get(os.path.join(battery_path, 'power_now'))
+
         if value:
-            power_uw = SystemUtilities.safe_int_conversion(value)
+            power_uw = SystemUtilities.fast_int(value)
             if power_uw:
                 power = round(abs(power_uw) / 1000000, 2)  # Convert microwatts to watts
                 result['power_draw'] = power
-                print(f"Linux power draw: {power}W")
+                logger.debug("Linux power draw: %sW", power)
                 return
         
         # Calculate from current and voltage if direct power not available
-        self._calculate_power_from_current(battery_path, result)
+        self._calculate_power_from_current(battery_path, values, result)
     
-    def _calculate_power_from_current(self, battery_path: str, result: Dict[str, Any]):
+    def _calculate_power_from_current(self, battery_path: str, values: Dict[str, Any], result: Dict[str, Any]):
         """Calculate power from current and voltage."""
-        current_file = os.path.join(battery_path, 'current_now')
-        current_value = SystemUtilities.safe_file_read(current_file)
-        
+        current_value = values.get(os.path.join(battery_path, 'current_now'))
+
         if current_value and result['voltage'] != "N/A":
-            current_ua = SystemUtilities.safe_int_conversion(current_value)
+            current_ua = SystemUtilities.fast_int(current_value)
             if current_ua:
                 current_a = abs(current_ua) / 1000000  # Convert to amps
                 power = round(result['voltage'] * current_a, 2)
                 result['power_draw'] = power
-                print(f"Linux calculated power: {power}W (V*I)")
-    
-    def _classify_power_metrics(self, result: Dict[str, Any]):
-        """Classify power draw and voltage status."""
-        from .config import POWER_DRAW_THRESHOLDS, VOLTAGE_THRESHOLDS
-        
-        # Calculate load severity
-        if result['power_draw'] != "N/A" and isinstance(result['power_draw'], (int, float)):
-            if result['power_draw'] < POWER_DRAW_THRESHOLDS['light']:
-                result['load_severity'] = "Light"
-            elif result['power_draw'] < POWER_DRAW_THRESHOLDS['moderate']:
-                result['load_severity'] = "Moderate"
-            else:
-                result['load_severity'] = "Heavy"
-            print(f"Load severity: {result['load_severity']}")
-        
-        # Determine voltage status
-        if result['voltage'] != "N/A" and isinstance(result['voltage'], (int, float)):
-            if result['voltage'] > VOLTAGE_THRESHOLDS['normal']:
-                result['voltage_status'] = "Normal"
-            elif result['voltage'] > VOLTAGE_THRESHOLDS['low']:
-                result['voltage_status'] = "Low"
-            else:
-                result['voltage_status'] = "Critical"
-            print(f"Voltage status: {result['voltage_status']}")
+                logger.debug("Linux calculated power: %sW (V*I)", power)
     
     def get_battery_temperature(self) -> str:
         """Get battery temperature from Linux."""
@@ -195,7 +215,7 @@ class LinuxBatteryDetector:
         if not battery_path:
             return "N/A"
         
-        print("Getting battery temperature from Linux /sys...")
+        logger.debug("Getting battery temperature from Linux /sys...")
         
         # Check for battery temperature files
         temp_files = ['temp', 'temperature']
@@ -205,7 +225,7 @@ class LinuxBatteryDetector:
             value = SystemUtilities.safe_file_read(file_path)
             
             if value:
-                temp_value = SystemUtilities.safe_int_conversion(value)
+                temp_value = SystemUtilities.fast_int(value)
                 if temp_value:
                     # Most Linux systems report in millidegrees or decidegrees Celsius
                     if temp_value > 1000:  # Likely in millidegrees
@@ -215,7 +235,7 @@ class LinuxBatteryDetector:
                     else:  # Already in degrees
                         temp_celsius = round(temp_value, 1)
                     
-                    print(f"Battery temperature from {temp_file}: {temp_celsius}°C")
+                    logger.debug("Battery temperature from %s: %s°C", temp_file, temp_celsius)
                     return temp_celsius
         
         # Try thermal zones as fallback
@@ -227,10 +247,10 @@ class LinuxBatteryDetector:
         for thermal_file in thermal_files:
             value = SystemUtilities.safe_file_read(thermal_file)
             if value:
-                temp_value = SystemUtilities.safe_int_conversion(value)
+                temp_value = SystemUtilities.fast_int(value)
                 if temp_value:
                     temp_celsius = round(temp_value / 1000, 1)  # Usually millidegrees
-                    print(f"Temperature from thermal zone: {temp_celsius}°C")
+                    logger.debug("Temperature from thermal zone: %s°C", temp_celsius)
                     return temp_celsius
         
         # Try sensors command as last resort
@@ -238,13 +258,13 @@ class LinuxBatteryDetector:
             success, output = SystemUtilities.safe_run_command(['sensors'], timeout=5)
             if success:
                 # Look for battery or ACPI temperature
-                temp_matches = re.findall(r'(Battery|ACPI|temp\d+).*?(\d+\.?\d*)\s*°C', output)
+                temp_matches = _SENSORS_TEMP_RE.findall(output)
                 if temp_matches:
                     temp_celsius = round(float(temp_matches[0][1]), 1)
-                    print(f"Linux temperature from sensors: {temp_celsius}°C")
+                    logger.debug("Linux temperature from sensors: %s°C", temp_celsius)
                     return temp_celsius
         except Exception as e:
-            print(f"Error with sensors command: {e}")
+            logger.warning("Error with sensors command: %s", e)
         
-        print("Final battery temperature result: N/A")
+        logger.debug("Final battery temperature result: N/A")
         return "N/A"
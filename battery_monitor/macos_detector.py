@@ -3,14 +3,80 @@
 macOS-specific battery detection using system utilities
 """
 
+import logging
 import re
+import subprocess
+import threading
+import time
 from typing import Dict, Any
-from .utils import SystemUtilities
+from .utils import SystemUtilities, classify_power_metrics
+
+logger = logging.getLogger(__name__)
+
+
+# One combined pattern covering every ioreg field get_battery_details needs,
+# compiled once so each parse is a single scan of the (multi-KB) output
+# instead of seven separate searches. Quoted values land in group 2,
+# bare values in group 3.
+_IOREG_DETAILS_RE = re.compile(
+    r'"(CycleCount|DesignCapacity|MaxCapacity|Manufacturer|DeviceName'
+    r'|DeviceChemistry|ExternalConnected)"\s*=\s*(?:"([^"]+)"|(\S+))')
+
+# ioreg field name -> details dict key
+_IOREG_DETAIL_KEYS = {
+    'CycleCount': 'cycle_count',
+    'DesignCapacity': 'design_capacity',
+    'MaxCapacity': 'full_charge_capacity',
+    'Manufacturer': 'manufacturer',
+    'DeviceName': 'name',
+    'DeviceChemistry': 'chemistry',
+    'ExternalConnected': 'status',
+}
+
+
+# Per-field ioreg patterns used by the voltage/power and temperature paths
+_IOREG_VOLTAGE_RE = re.compile(r'"Voltage" = (\d+)')
+_IOREG_AMPERAGE_RE = re.compile(r'"InstantAmperage" = (-?\d+)')
+_IOREG_TEMP_RE = re.compile(r'"Temperature" = (\d+)')
+
+# Battery temperature line in powermetrics' streaming CSV output
+_PM_BATTERY_TEMP_RE = re.compile(r'Battery.*?(\d+\.?\d*)')
 
 
 class MacOSBatteryDetector:
     """macOS-specific battery detection using system utilities."""
-    
+
+    def __init__(self):
+        # Long-lived powermetrics stream; started on first temperature
+        # request so the other detector paths never pay for it
+        self._pm_proc = None
+        self._pm_failed = False
+        self._temp_lock = threading.Lock()
+        self._latest_temp = None
+        # One ioreg snapshot per tick, shared by details/voltage/temperature
+        self._ioreg_cache = (0.0, None)
+
+    def _get_ioreg(self, ttl: float = 0.5):
+        """Run ioreg at most once per ttl window and share the output.
+
+        Details, voltage/power and temperature all parse the same
+        AppleSmartBattery blob; within one sampling tick only the first
+        caller pays the fork/exec.
+        """
+        cached_at, output = self._ioreg_cache
+        now = time.monotonic()
+        if output is not None and now - cached_at < ttl:
+            return output
+
+        success, fresh = SystemUtilities.safe_run_command([
+            'ioreg', '-rc', 'AppleSmartBattery'
+        ], timeout=10)
+        if not success:
+            return output  # Keep serving the stale blob if the rerun failed
+
+        self._ioreg_cache = (now, fresh)
+        return fresh
+
     def get_battery_details(self) -> Dict[str, Any]:
         """Get battery details from macOS system utilities."""
         details = {
@@ -25,59 +91,49 @@ class MacOSBatteryDetector:
             'design_voltage': "N/A"
         }
         
-        print("Getting battery details from macOS...")
+        logger.debug("Getting battery details from macOS...")
         
         try:
-            success, output = SystemUtilities.safe_run_command([
-                'ioreg', '-rc', 'AppleSmartBattery'
-            ], timeout=10)
-            
-            if success:
+            output = self._get_ioreg()
+            if output is not None:
                 self._parse_ioreg_output(output, details)
                 self._calculate_health(details)
                 
         except Exception as e:
-            print(f"Error getting macOS battery details: {e}")
+            logger.warning("Error getting macOS battery details: %s", e)
         
         return details
     
     def _parse_ioreg_output(self, output: str, details: Dict[str, Any]):
-        """Parse ioreg output for battery information."""
-        patterns = {
-            'cycle_count': r'"CycleCount" = (\d+)',
-            'design_capacity': r'"DesignCapacity" = (\d+)',
-            'full_charge_capacity': r'"MaxCapacity" = (\d+)',
-            'manufacturer': r'"Manufacturer" = "([^"]+)"',
-            'name': r'"DeviceName" = "([^"]+)"',
-            'chemistry': r'"DeviceChemistry" = "([^"]+)"',
-            'status': r'"ExternalConnected" = (Yes|No)',
-        }
-        
-        for key, pattern in patterns.items():
-            match = re.search(pattern, output)
-            if match:
-                value = match.group(1)
-                # Convert numeric values
-                if key in ['cycle_count', 'design_capacity', 'full_charge_capacity']:
-                    numeric_value = SystemUtilities.safe_int_conversion(value)
-                    if numeric_value is not None:
-                        details[key] = numeric_value
-                        print(f"{key}: {numeric_value}")
-                else:
-                    details[key] = value
-                    print(f"{key}: {value}")
+        """Parse ioreg output for battery information in a single pass."""
+        seen = set()
+        for match in _IOREG_DETAILS_RE.finditer(output):
+            key = _IOREG_DETAIL_KEYS[match.group(1)]
+            if key in seen:  # Keep the first occurrence, like re.search did
+                continue
+            seen.add(key)
+
+            value = match.group(2) or match.group(3)
+            # Convert numeric values
+            if key in ['cycle_count', 'design_capacity', 'full_charge_capacity']:
+                numeric_value = SystemUtilities.safe_int_conversion(value)
+                if numeric_value is not None:
+                    details[key] = numeric_value
+                    logger.debug("%s: %s", key, numeric_value)
+            else:
+                details[key] = value
+                logger.debug("%s: %s", key, value)
     
     def _calculate_health(self, details: Dict[str, Any]):
         """Calculate battery health from design and full capacity."""
-        if (details['design_capacity'] != "N/A" and 
-            details['full_charge_capacity'] != "N/A" and 
-            isinstance(details['design_capacity'], (int, float)) and 
-            isinstance(details['full_charge_capacity'], (int, float)) and
-            details['design_capacity'] > 0):
-            
+        try:
+            # The capacities are either ints from safe_int_conversion or the
+            # "N/A" sentinel; the division raises on anything non-numeric
             health_pct = (details['full_charge_capacity'] / details['design_capacity']) * 100
-            details['health'] = round(health_pct, 1)
-            print(f"Calculated health: {details['health']}%")
+        except (TypeError, ZeroDivisionError):
+            return
+        details['health'] = round(health_pct, 1)
+        logger.debug("Calculated health: %s%%", details['health'])
     
     def get_voltage_and_power(self) -> Dict[str, Any]:
         """Get voltage and power information from macOS."""
@@ -89,95 +145,98 @@ class MacOSBatteryDetector:
         }
         
         try:
-            print("Getting voltage and power from macOS...")
-            success, output = SystemUtilities.safe_run_command([
-                'ioreg', '-rc', 'AppleSmartBattery'
-            ], timeout=10)
-            
-            if success:
+            logger.debug("Getting voltage and power from macOS...")
+            output = self._get_ioreg()
+
+            if output is not None:
                 # Look for voltage in ioreg output
-                voltage_match = re.search(r'"Voltage" = (\d+)', output)
+                voltage_match = _IOREG_VOLTAGE_RE.search(output)
                 if voltage_match:
                     voltage_mv = int(voltage_match.group(1))
                     result['voltage'] = round(voltage_mv / 1000, 2)
-                    print(f"macOS voltage: {result['voltage']}V")
+                    logger.debug("macOS voltage: %sV", result['voltage'])
                 
                 # Look for power draw (calculate from amperage)
-                power_match = re.search(r'"InstantAmperage" = (-?\d+)', output)
+                power_match = _IOREG_AMPERAGE_RE.search(output)
                 if power_match and result['voltage'] != "N/A":
                     amperage = abs(int(power_match.group(1))) / 1000  # Convert to amps
                     result['power_draw'] = round(result['voltage'] * amperage, 2)
-                    print(f"macOS power draw: {result['power_draw']}W")
+                    logger.debug("macOS power draw: %sW", result['power_draw'])
             
-            self._classify_power_metrics(result)
+            classify_power_metrics(result)
                         
         except Exception as e:
-            print(f"Error getting macOS voltage/power: {e}")
+            logger.warning("Error getting macOS voltage/power: %s", e)
         
         return result
     
-    def _classify_power_metrics(self, result: Dict[str, Any]):
-        """Classify power draw and voltage status."""
-        from .config import POWER_DRAW_THRESHOLDS, VOLTAGE_THRESHOLDS
-        
-        # Calculate load severity
-        if result['power_draw'] != "N/A" and isinstance(result['power_draw'], (int, float)):
-            if result['power_draw'] < POWER_DRAW_THRESHOLDS['light']:
-                result['load_severity'] = "Light"
-            elif result['power_draw'] < POWER_DRAW_THRESHOLDS['moderate']:
-                result['load_severity'] = "Moderate"
-            else:
-                result['load_severity'] = "Heavy"
-            print(f"Load severity: {result['load_severity']}")
-        
-        # Determine voltage status
-        if result['voltage'] != "N/A" and isinstance(result['voltage'], (int, float)):
-            if result['voltage'] > VOLTAGE_THRESHOLDS['normal']:
-                result['voltage_status'] = "Normal"
-            elif result['voltage'] > VOLTAGE_THRESHOLDS['low']:
-                result['voltage_status'] = "Low"
-            else:
-                result['voltage_status'] = "Critical"
-            print(f"Voltage status: {result['voltage_status']}")
-    
-    def get_battery_temperature(self) -> str:
-        """Get battery temperature from macOS."""
-        print("Getting battery temperature from macOS...")
-        
+    def _start_powermetrics(self):
+        """Spawn powermetrics once in streaming mode with a reader thread.
+
+        A fresh one-shot run costs fork/exec plus the mandatory sample
+        window (~100-200 ms) on every tick; the stream pays that once and
+        each poll just returns the newest published value.
+        """
         try:
-            # Try powermetrics for thermal data
-            success, output = SystemUtilities.safe_run_command([
-                'powermetrics', '--sample-interval', '100', '--sample-count', '1', '-f', 'csv'
-            ], timeout=10)
-            
-            if success:
-                # Look for battery temperature in the output
-                temp_match = re.search(r'Battery.*?(\d+\.?\d*)', output)
-                if temp_match:
-                    temp_celsius = round(float(temp_match.group(1)), 1)
-                    print(f"macOS temperature from powermetrics: {temp_celsius}°C")
-                    return temp_celsius
-                    
+            self._pm_proc = subprocess.Popen(
+                ['powermetrics', '--sample-interval', '1000', '-f', 'csv'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, encoding='utf-8', errors='ignore')
+            threading.Thread(target=self._powermetrics_reader, daemon=True).start()
         except Exception as e:
-            print(f"Error with macOS powermetrics: {e}")
+            logger.warning("Error starting macOS powermetrics: %s", e)
+            self._pm_failed = True
+
+    def _powermetrics_reader(self):
+        """Publish the newest battery temperature from the stream."""
+        try:
+            for line in self._pm_proc.stdout:
+                temp_match = _PM_BATTERY_TEMP_RE.search(line)
+                if temp_match:
+                    with self._temp_lock:
+                        self._latest_temp = round(float(temp_match.group(1)), 1)
+        except Exception:
+            pass
+        # Stream ended (powermetrics may require root). Drop the last
+        # published value so polls fall back to ioreg instead of serving
+        # the final reading as live data forever
+        with self._temp_lock:
+            self._latest_temp = None
+        self._pm_failed = True
+
+    def __del__(self):
+        proc = getattr(self, '_pm_proc', None)
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+
+    def get_battery_temperature(self) -> str:
+        """Get battery temperature from macOS."""
+        logger.debug("Getting battery temperature from macOS...")
+
+        if self._pm_proc is None and not self._pm_failed:
+            self._start_powermetrics()
+
+        with self._temp_lock:
+            latest_temp = self._latest_temp
+
+        if latest_temp is not None:
+            logger.debug("macOS temperature from powermetrics: %s°C", latest_temp)
+            return latest_temp
         
         try:
-            # Try ioreg as fallback
-            success, output = SystemUtilities.safe_run_command([
-                'ioreg', '-rc', 'AppleSmartBattery'
-            ], timeout=10)
-            
-            if success:
+            # Try the shared ioreg snapshot as fallback
+            output = self._get_ioreg()
+            if output is not None:
                 # Look for temperature-related fields
-                temp_match = re.search(r'"Temperature" = (\d+)', output)
+                temp_match = _IOREG_TEMP_RE.search(output)
                 if temp_match:
                     # ioreg typically reports in tenths of degrees Celsius
                     temp_celsius = round(int(temp_match.group(1)) / 10, 1)
-                    print(f"macOS temperature from ioreg: {temp_celsius}°C")
+                    logger.debug("macOS temperature from ioreg: %s°C", temp_celsius)
                     return temp_celsius
                     
         except Exception as e:
-            print(f"Error with macOS ioreg: {e}")
+            logger.warning("Error with macOS ioreg: %s", e)
         
-        print("Final battery temperature result: N/A")
+        logger.debug("Final battery temperature result: N/A")
         return "N/A"
@@ -3,10 +3,25 @@
 System metrics collection for battery logging
 """
 
+import heapq
+import logging
+import os
+import time
 import psutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
-from .utils import SystemUtilities, PlatformDetector
+from .utils import SystemUtilities, PlatformDetector, powershell_session
+
+logger = logging.getLogger(__name__)
+
+# Charging-time stages: estimates at or below the threshold (in minutes)
+# map to the given status label
+_CHARGE_STAGES = (
+    (5, "Nearly Full"),
+    (30, "Fast Charging"),
+    (float('inf'), "Charging"),
+)
 
 
 class SystemMetrics:
@@ -14,35 +29,62 @@ class SystemMetrics:
     
     def __init__(self, platform_detector: PlatformDetector):
         self.platform = platform_detector
+        # Previous-tick CPU tick totals per PID for the direct /proc scan
+        self._proc_prev_times = {}
+        self._proc_prev_ts = time.monotonic()
+        self._clk_tck = os.sysconf('SC_CLK_TCK') if platform_detector.is_linux() else 100
+        # Prime psutil's internal CPU-times snapshot so the first
+        # non-blocking cpu_percent call below already has a valid baseline
+        psutil.cpu_percent(interval=None)
+        # Persistent pool for running the independent per-tick collectors
+        # concurrently; they all block on I/O (sysfs, /proc, subprocesses)
+        self._pool = ThreadPoolExecutor(max_workers=4)
+        # Backlight path and its max_brightness are fixed per boot; resolved
+        # on the first get_brightness call and reused afterwards
+        self._brightness_path = None
+        self._max_brightness = None
+        # Cached descriptor for /proc/net/dev on Linux
+        self._net_dev_fd = None
+        # Winning hwmon temperature file, resolved once on Linux
+        self._temp_sensor_path = None
+
+    def gather_all(self) -> dict:
+        """Collect all per-tick metrics concurrently.
+
+        The collectors are independent and I/O-bound, so running them on the
+        pool drops the tick's wall time from the sum of their latencies to
+        the slowest one. Returns one consistent snapshot for the tick.
+        """
+        futures = {
+            'system_stats': self._pool.submit(self.get_system_stats),
+            'brightness': self._pool.submit(self.get_brightness),
+            'cpu_temperature': self._pool.submit(self.get_cpu_temperature),
+            'network_bytes': self._pool.submit(self.get_network_stats),
+            'top_processes': self._pool.submit(self.get_top_processes),
+        }
+        return {key: future.result() for key, future in futures.items()}
     
     def get_brightness(self) -> str:
         """Get current display brightness (0-100) - cross-platform."""
         try:
             if self.platform.is_windows():
-                success, output = SystemUtilities.safe_run_command([
-                    'powershell', '-Command',
-                    '(Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightness).CurrentBrightness'
-                ], timeout=5)
+                # The shared host avoids paying PowerShell startup on
+                # every brightness poll
+                success, output = powershell_session.run(
+                    '(Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightness).CurrentBrightness',
+                    timeout=5)
                 if success and output.isdigit():
                     return output
                     
             elif self.platform.is_linux():
-                brightness_paths = [
-                    '/sys/class/backlight/intel_backlight/brightness',
-                    '/sys/class/backlight/acpi_video0/brightness'
-                ]
-                for path in brightness_paths:
-                    brightness_value = SystemUtilities.safe_file_read(path)
+                if self._brightness_path is None:
+                    self._resolve_brightness_path()
+                if self._brightness_path:
+                    brightness_value = SystemUtilities.safe_file_read(self._brightness_path)
                     if brightness_value:
-                        brightness = SystemUtilities.safe_int_conversion(brightness_value)
+                        brightness = SystemUtilities.fast_int(brightness_value)
                         if brightness is not None:
-                            # Get max brightness
-                            max_path = path.replace('brightness', 'max_brightness')
-                            max_brightness_value = SystemUtilities.safe_file_read(max_path)
-                            if max_brightness_value:
-                                max_brightness = SystemUtilities.safe_int_conversion(max_brightness_value)
-                                if max_brightness and max_brightness > 0:
-                                    return str(round((brightness / max_brightness) * 100))
+                            return str(round((brightness / self._max_brightness) * 100))
                         
             elif self.platform.is_macos():
                 success, output = SystemUtilities.safe_run_command([
@@ -56,12 +98,37 @@ class SystemMetrics:
                         return str(brightness)
                         
         except Exception as e:
-            print(f"Error getting brightness: {e}")
+            logger.warning("Error getting brightness: %s", e)
         
         return "N/A"
-    
+
+    def _resolve_brightness_path(self):
+        """Probe the known backlight paths once and cache the winner.
+
+        max_brightness never changes within a boot, so it is read here and
+        kept as an int; the per-tick path then reads only `brightness`.
+        """
+        brightness_paths = [
+            '/sys/class/backlight/intel_backlight/brightness',
+            '/sys/class/backlight/acpi_video0/brightness'
+        ]
+        for path in brightness_paths:
+            max_path = path.replace('brightness', 'max_brightness')
+            max_brightness = SystemUtilities.fast_int(
+                SystemUtilities.safe_file_read(max_path))
+            if max_brightness and max_brightness > 0:
+                self._brightness_path = path
+                self._max_brightness = max_brightness
+                return
+        self._brightness_path = ""  # Probed, nothing usable
+
     def get_cpu_temperature(self) -> str:
         """Get CPU temperature if available - cross-platform."""
+        if self.platform.is_linux():
+            temp = self._read_hwmon_cpu_temp()
+            if temp is not None:
+                return temp
+
         try:
             # Try psutil sensors first
             temps = psutil.sensors_temperatures()
@@ -81,7 +148,7 @@ class SystemMetrics:
             if self.platform.is_linux():
                 temp_value = SystemUtilities.safe_file_read('/sys/class/thermal/thermal_zone0/temp')
                 if temp_value:
-                    temp_int = SystemUtilities.safe_int_conversion(temp_value)
+                    temp_int = SystemUtilities.fast_int(temp_value)
                     if temp_int:
                         temp = temp_int / 1000
                         return str(round(temp, 1))
@@ -94,58 +161,171 @@ class SystemMetrics:
                     return f"State: {output}"
         
         return "N/A"
-    
+
+    def _resolve_temp_sensor_path(self):
+        """Locate the CPU hwmon temperature file once.
+
+        Walks /sys/class/hwmon/*/name looking for a CPU sensor (matching
+        the same cpu/core preference as the psutil scan) and caches its
+        temp1_input path; an empty string records that nothing matched so
+        the probe never reruns."""
+        try:
+            for entry in os.scandir('/sys/class/hwmon'):
+                name = SystemUtilities.safe_file_read(os.path.join(entry.path, 'name'))
+                if name and ('cpu' in name.lower() or 'core' in name.lower()):
+                    temp_path = os.path.join(entry.path, 'temp1_input')
+                    if os.path.exists(temp_path):
+                        self._temp_sensor_path = temp_path
+                        return
+        except OSError:
+            pass
+        self._temp_sensor_path = ""
+
+    def _read_hwmon_cpu_temp(self):
+        """Read the memoized CPU sensor directly, one pread per tick.
+
+        Returns None when no direct sensor is available, letting the
+        caller fall through to the full psutil scan."""
+        if self._temp_sensor_path is None:
+            self._resolve_temp_sensor_path()
+        if not self._temp_sensor_path:
+            return None
+
+        temp_value = SystemUtilities.fast_int(
+            SystemUtilities.safe_file_read(self._temp_sensor_path))
+        if temp_value is None:
+            return None
+        return str(round(temp_value / 1000, 1))  # hwmon reports millidegrees
+
     def get_network_stats(self) -> int:
         """Get total network bytes sent + received."""
+        if self.platform.is_linux():
+            total = self._read_proc_net_dev()
+            if total is not None:
+                return total
         try:
             net_io = psutil.net_io_counters()
             return net_io.bytes_sent + net_io.bytes_recv
         except:
             return 0
+
+    def _read_proc_net_dev(self):
+        """Sum rx+tx bytes over all interfaces from /proc/net/dev.
+
+        One pread over a kept-open descriptor replaces psutil's
+        per-interface namedtuple construction; columns 1 and 9 after the
+        interface name are rx_bytes and tx_bytes.
+        """
+        try:
+            if self._net_dev_fd is None:
+                self._net_dev_fd = os.open('/proc/net/dev', os.O_RDONLY)
+            data = os.pread(self._net_dev_fd, 65536, 0)
+
+            total = 0
+            for line in data.splitlines()[2:]:  # Skip the two header lines
+                fields = line.split()
+                total += int(fields[1]) + int(fields[9])
+            return total
+        except Exception:
+            return None
     
     def get_charging_info(self, battery) -> Tuple[str, str]:
         """Get charging time estimate and charging status."""
         if not battery or not battery.power_plugged:
             return "N/A", "N/A"
-        
-        try:
-            current_percent = battery.percent
-            if current_percent >= 100:
-                return "0", "Full"
-            
-            # Rough estimate: assume ~2 hours to charge from 0 to 100%
-            estimated_minutes = (100 - current_percent) * 1.2
-            
-            if estimated_minutes <= 5:
-                return str(estimated_minutes), "Nearly Full"
-            elif estimated_minutes <= 30:
-                return str(estimated_minutes), "Fast Charging"
-            else:
-                return str(estimated_minutes), "Charging"
-        except:
-            return "N/A", "N/A"
+
+        current_percent = battery.percent
+        if current_percent >= 100:
+            return "0", "Full"
+
+        # Rough estimate: assume ~2 hours to charge from 0 to 100%
+        estimated_minutes = (100 - current_percent) * 1.2
+        estimate = str(estimated_minutes)
+
+        for threshold, status in _CHARGE_STAGES:
+            if estimated_minutes <= threshold:
+                return estimate, status
     
     def get_top_processes(self, limit: int = 10) -> str:
         """Get top processes by CPU usage."""
+        if self.platform.is_linux():
+            return self._get_top_processes_proc(limit)
+
         try:
-            processes = [(p.info['name'], p.info['cpu_percent']) 
-                        for p in psutil.process_iter(['name', 'cpu_percent'])]
+            processes = []
+            for p in psutil.process_iter():
+                try:
+                    # oneshot() batches the per-process attribute reads into a
+                    # single syscall round-trip instead of one per attribute
+                    with p.oneshot():
+                        processes.append((p.name(), p.cpu_percent()))
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
             top_processes = sorted(processes, key=lambda x: x[1] if x[1] is not None else 0, reverse=True)[:limit]
             return "; ".join([f"{name}:{cpu}%" for name, cpu in top_processes])
         except:
             return "N/A"
+
+    def _get_top_processes_proc(self, limit: int) -> str:
+        """Rank processes by CPU via direct /proc/<pid>/stat reads.
+
+        One read per PID replaces psutil's several syscalls per process;
+        CPU usage is the utime+stime tick delta against the previous call,
+        so no blocking sample interval is needed. heapq.nlargest keeps the
+        ranking at O(n log limit) instead of a full sort.
+        """
+        try:
+            now = time.monotonic()
+            elapsed = now - self._proc_prev_ts
+            scale = 100.0 / (elapsed * self._clk_tck) if elapsed > 0 else 0.0
+
+            current = {}
+            usage = []
+            for name in os.listdir('/proc'):
+                if not name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{name}/stat', 'rb') as f:
+                        data = f.read()
+                except OSError:
+                    continue  # Process exited mid-scan
+
+                # comm sits between the outermost parens; the space-separated
+                # fields after the closing paren put utime/stime at 11 and 12
+                open_paren = data.index(b'(')
+                close_paren = data.rindex(b')')
+                comm = data[open_paren + 1:close_paren].decode('utf-8', 'ignore')
+                fields = data[close_paren + 2:].split(b' ')
+                ticks = int(fields[11]) + int(fields[12])
+
+                pid = int(name)
+                current[pid] = ticks
+                prev = self._proc_prev_times.get(pid)
+                cpu = round((ticks - prev) * scale, 1) if prev is not None else 0.0
+                usage.append((comm, cpu))
+
+            self._proc_prev_times = current
+            self._proc_prev_ts = now
+
+            top_processes = heapq.nlargest(limit, usage, key=lambda x: x[1])
+            return "; ".join([f"{name}:{cpu}%" for name, cpu in top_processes])
+        except Exception:
+            return "N/A"
     
     def get_system_stats(self) -> dict:
         """Get comprehensive system statistics."""
         try:
             return {
-                'cpu_percent': psutil.cpu_percent(interval=1),
+                # Non-blocking: rates CPU against the previous call's
+                # snapshot; the logging loop's own cadence provides the
+                # sampling window, so no one-second sleep is needed here
+                'cpu_percent': psutil.cpu_percent(interval=None),
                 'ram_percent': psutil.virtual_memory().percent,
                 'disk_percent': psutil.disk_usage('/').percent if self.platform.is_linux() or self.platform.is_macos() 
                              else psutil.disk_usage('C:\\').percent
             }
         except Exception as e:
-            print(f"Error getting system stats: {e}")
+            logger.warning("Error getting system stats: %s", e)
             return {
                 'cpu_percent': "N/A",
                 'ram_percent': "N/A", 
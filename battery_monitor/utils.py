@@ -3,11 +3,20 @@
 Utility functions for system operations and data formatting
 """
 
+import atexit
+import logging
+import os
 import subprocess
 import re
 import platform
+import threading
 from typing import List, Tuple, Optional
 
+logger = logging.getLogger(__name__)
+
+# Standalone integer tokens, compiled once for the text-scraping helpers
+_NUM_RE = re.compile(r'\b(\d+)\b')
+
 
 class PlatformDetector:
     """Handles platform detection and module imports."""
@@ -38,6 +47,125 @@ class PlatformDetector:
         return self.platform == 'darwin'
 
 
+def classify_power_metrics(result, verbose=True):
+    """Classify power draw and voltage status in place.
+
+    Shared by all platform detectors; the per-tick numbers land in the
+    same result dict every backend produces. Numeric comparisons only run
+    when the values are real numbers (the "N/A" sentinel skips them).
+    """
+    from .config import POWER_DRAW_THRESHOLDS, VOLTAGE_THRESHOLDS
+
+    # Calculate load severity
+    if result['power_draw'] != "N/A" and isinstance(result['power_draw'], (int, float)):
+        if result['power_draw'] < POWER_DRAW_THRESHOLDS['light']:
+            result['load_severity'] = "Light"
+        elif result['power_draw'] < POWER_DRAW_THRESHOLDS['moderate']:
+            result['load_severity'] = "Moderate"
+        else:
+            result['load_severity'] = "Heavy"
+        if verbose:
+            logger.debug("Load severity: %s", result['load_severity'])
+
+    # Determine voltage status
+    if result['voltage'] != "N/A" and isinstance(result['voltage'], (int, float)):
+        if result['voltage'] > VOLTAGE_THRESHOLDS['normal']:
+            result['voltage_status'] = "Normal"
+        elif result['voltage'] > VOLTAGE_THRESHOLDS['low']:
+            result['voltage_status'] = "Low"
+        else:
+            result['voltage_status'] = "Critical"
+        if verbose:
+            logger.debug("Voltage status: %s", result['voltage_status'])
+
+
+class PowerShellSession:
+    """Long-lived PowerShell host for commands that run every tick.
+
+    Spawning powershell.exe costs seconds per invocation; a single
+    '-Command -' host keeps reading commands from stdin, so each call is
+    one pipe round-trip. A sentinel line marks the end of each command's
+    output. The process is only started on the first run() call.
+    """
+
+    _SENTINEL = '<<<END>>>'
+    _COMMAND = ['powershell', '-NoProfile', '-NonInteractive', '-Command', '-']
+
+    def __init__(self):
+        self._proc = None
+        self._lock = threading.Lock()
+
+    def _ensure_proc(self):
+        """Start (or restart) the host; caller holds the lock."""
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                self._COMMAND,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True, encoding='utf-8', errors='ignore', bufsize=1)
+        return self._proc
+
+    def run(self, command: str, timeout: float = 10) -> Tuple[bool, str]:
+        """Run one command in the shared host; returns (success, output).
+
+        A timer kills the host if the sentinel does not arrive within
+        timeout seconds (a wedged WMI provider would otherwise block the
+        read forever while holding the lock); the kill turns the read
+        into EOF, the call fails, and the next run() respawns the host.
+        """
+        with self._lock:
+            try:
+                proc = self._ensure_proc()
+                proc.stdin.write(
+                    command + "\nWrite-Output '" + self._SENTINEL + "'\n")
+                proc.stdin.flush()
+
+                timer = threading.Timer(timeout, self._kill, args=(proc,))
+                timer.start()
+                try:
+                    lines = []
+                    for line in proc.stdout:
+                        if self._SENTINEL in line:
+                            return True, '\n'.join(lines).strip()
+                        lines.append(line.rstrip('\n'))
+                finally:
+                    timer.cancel()
+
+                # EOF before the sentinel: the host died mid-command or the
+                # timer killed it. Drop it so the next call respawns one.
+                self._terminate()
+                return False, ''
+            except Exception as e:
+                self._terminate()
+                return False, str(e)
+
+    @staticmethod
+    def _kill(proc):
+        """Timer callback: force EOF on a host that missed its deadline."""
+        try:
+            proc.kill()
+        except OSError:
+            pass
+
+    def _terminate(self):
+        if self._proc is not None:
+            try:
+                self._proc.terminate()
+            except OSError:
+                pass
+            self._proc = None
+
+    def close(self):
+        """Shut the host down (registered with atexit)."""
+        with self._lock:
+            self._terminate()
+
+
+# Shared host instance; idle (and unspawned) unless a PowerShell-dependent
+# path is actually exercised
+powershell_session = PowerShellSession()
+
+
 class SystemUtilities:
     """Utility functions for system operations and formatting."""
     
@@ -55,35 +183,83 @@ class SystemUtilities:
     def safe_run_command(command: List[str], timeout: int = 10) -> Tuple[bool, str]:
         """Safely run a system command and return success status and output."""
         try:
+            # Capture raw bytes (no TextIOWrapper around the pipe) and decode
+            # once at the boundary, ignoring encoding errors
             result = subprocess.run(
-                command, 
-                capture_output=True, 
-                text=True, 
-                timeout=timeout,
-                encoding='utf-8',
-                errors='ignore'  # Ignore encoding errors
+                command,
+                capture_output=True,
+                timeout=timeout
             )
-            return result.returncode == 0, result.stdout.strip()
+            return result.returncode == 0, result.stdout.decode('utf-8', 'ignore').strip()
         except Exception as e:
             return False, str(e)
     
+    @staticmethod
+    def iter_numbers_from_text(text: str):
+        """Yield the numbers in text lazily, without building a list."""
+        for match in _NUM_RE.finditer(text):
+            yield int(match.group(1))
+
     @staticmethod
     def extract_numbers_from_text(text: str) -> List[int]:
         """Extract all numbers from text."""
-        try:
-            return [int(match) for match in re.findall(r'\b(\d+)\b', text)]
-        except ValueError:
-            return []
+        return list(SystemUtilities.iter_numbers_from_text(text))
     
+    # Descriptors for the small sysfs/procfs attributes the logger polls
+    # every tick; kept open so re-reads cost a single pread syscall instead
+    # of open/read/close plus a fresh TextIOWrapper each time
+    _fd_cache = {}
+
     @staticmethod
     def safe_file_read(file_path: str) -> Optional[str]:
-        """Safely read a file and return its content."""
+        """Safely read a file and return its content.
+
+        The file descriptor is cached per path; sysfs attributes always
+        serve fresh values from offset 0, so os.pread re-reads the current
+        content without reopening or seeking.
+        """
         try:
-            with open(file_path, 'r') as f:
-                return f.read().strip()
+            fd = SystemUtilities._fd_cache.get(file_path)
+            if fd is None:
+                fd = os.open(file_path, os.O_RDONLY)
+                SystemUtilities._fd_cache[file_path] = fd
+            return os.pread(fd, 128, 0).decode('utf-8', 'ignore').strip()
         except Exception:
             return None
+
+    @staticmethod
+    def batch_read_paths(paths: List[str]) -> dict:
+        """Read several small files in one pass over the cached descriptors.
+
+        Callers that need a handful of sysfs attributes per tick enumerate
+        them up front and get back a path -> content mapping (missing or
+        unreadable files map to None), keeping the per-tick cost to one
+        pread per file with no reopening.
+        """
+        return {path: SystemUtilities.safe_file_read(path) for path in paths}
+
+    @staticmethod
+    def _close_cached_fds():
+        """Close all cached descriptors (registered with atexit)."""
+        for fd in SystemUtilities._fd_cache.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        SystemUtilities._fd_cache.clear()
     
+    @staticmethod
+    def fast_int(value: Optional[str]) -> Optional[int]:
+        """Convert a trusted decimal string without an exception frame.
+
+        Sysfs attributes are always plain (possibly negative) decimal
+        integers, so an isdigit check beats try/except on the hot path.
+        Untrusted subprocess output should keep using safe_int_conversion.
+        """
+        if value and (value.isdigit() or (value[0] == '-' and value[1:].isdigit())):
+            return int(value)
+        return None
+
     @staticmethod
     def safe_int_conversion(value: str) -> Optional[int]:
         """Safely convert string to integer."""
@@ -99,3 +275,7 @@ class SystemUtilities:
             return float(value)
         except (ValueError, TypeError):
             return None
+
+
+atexit.register(SystemUtilities._close_cached_fds)
+atexit.register(powershell_session.close)
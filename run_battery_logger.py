@@ -3,11 +3,12 @@
 Entry point for the Battery Logger application
 """
 
+import atexit
 import sys
 import os
 import multiprocessing
 import signal
-import time
+import threading
 from battery_monitor import BatteryLogger
 from settings_server import run_settings_server
 
@@ -33,44 +34,33 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     
     try:
-        # Create processes for the logger and the server
+        # The logger gets its own process; the settings server spends its
+        # life blocked in accept() and shares no mutable state with the
+        # logger, so a daemon thread is enough and dies with the process
         logger_process = multiprocessing.Process(target=start_logger)
-        server_process = multiprocessing.Process(target=start_server)
+        server_thread = threading.Thread(target=start_server, daemon=True)
 
-        # Start both processes
         logger_process.start()
-        server_process.start()
-        
-        print("Battery logger and settings server started. Press Ctrl+C to stop.")
+        server_thread.start()
 
-        try:
-            # Wait for processes with timeout to allow graceful shutdown
-            while logger_process.is_alive() or server_process.is_alive():
-                time.sleep(0.1)
-        except KeyboardInterrupt:
-            print("\nReceived interrupt signal. Stopping processes...")
-            
-            # Terminate processes gracefully
+        # However the launcher exits -- signal, exception or normal return --
+        # the logger must not outlive it
+        def stop_logger():
             if logger_process.is_alive():
                 logger_process.terminate()
-            if server_process.is_alive():
-                server_process.terminate()
-            
-            # Wait a bit for graceful termination
-            time.sleep(1)
-            
-            # Force kill if still alive
-            if logger_process.is_alive():
-                logger_process.kill()
-            if server_process.is_alive():
-                server_process.kill()
-            
-            # Final cleanup
-            logger_process.join(timeout=2)
-            server_process.join(timeout=2)
-            
-            print("All processes stopped.")
-            
+                logger_process.join(timeout=2)
+                if logger_process.is_alive():
+                    logger_process.kill()
+
+        atexit.register(stop_logger)
+
+        print("Battery logger and settings server started. Press Ctrl+C to stop.")
+
+        # Block without periodic wakeups until the logger exits or a signal
+        # arrives; signal_handler's SystemExit propagates through join() and
+        # the atexit hook handles the teardown
+        logger_process.join()
+        
     except Exception as e:
         print(f"Fatal error: {e}")
         sys.exit(1)
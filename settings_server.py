@@ -5,26 +5,213 @@ Simple HTTP server to handle settings updates for the Battery Log visualization
 
 import json
 import os
+import re
+import signal
+import sys
 import pandas as pd
-from http.server import HTTPServer, BaseHTTPRequestHandler, SimpleHTTPRequestHandler
+from functools import lru_cache
+import socket
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler, SimpleHTTPRequestHandler
 from urllib.parse import parse_qs
 import threading
 import time
 
-class CombinedHandler(SimpleHTTPRequestHandler):
-    def normalize_keys(self, data):
-        """Convert camelCase keys to snake_case."""
-        def camel_to_snake(name):
-            import re
-            s1 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', name)
-            return s1.lower()
-
-        if isinstance(data, dict):
-            return {camel_to_snake(k): self.normalize_keys(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self.normalize_keys(i) for i in data]
+# orjson serializes several times faster and returns bytes directly; the
+# stdlib fallback at least skips the pretty-printing separators. The on-disk
+# settings file keeps indent=4 so it stays hand-editable.
+try:
+    import orjson
+
+    def _dumps(obj, default=None):
+        """Serialize an HTTP response body to bytes."""
+        # OPT_SERIALIZE_NUMPY keeps any NumPy scalar in the estimation
+        # payload a JSON number instead of routing it through default=
+        return orjson.dumps(obj, default=default,
+                            option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _dumps(obj, default=None):
+        """Serialize an HTTP response body to bytes (stdlib fallback)."""
+        return json.dumps(obj, separators=(',', ':'), default=default).encode()
+
+
+# camelCase boundary, compiled once for the key normalizer
+_CAMEL_RE = re.compile(r'([a-z0-9])([A-Z])')
+
+
+@lru_cache(maxsize=256)
+def camel_to_snake(name):
+    """Convert a camelCase key to snake_case.
+
+    The settings JSON only ever uses a handful of distinct keys, so the
+    cache serves virtually every conversion after the first request.
+    """
+    return _CAMEL_RE.sub(r'\1_\2', name).lower()
+
+
+def normalize_keys(data):
+    """Recursively convert camelCase keys to snake_case."""
+    if isinstance(data, dict):
+        return {camel_to_snake(k): normalize_keys(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [normalize_keys(i) for i in data]
+    else:
+        return data
+
+_SETTINGS_FILE = 'user_settings.json'
+_DEFAULT_SETTINGS = {
+    "logging": {"log_interval": 60},
+    "visualization": {"time_range": "1h", "auto_refresh": True,
+                      "refresh_interval": 60000}
+}
+
+# In-memory settings guarded by a lock; the handler threads merge updates
+# here and only touch the disk when a value actually changed
+_SETTINGS_LOCK = threading.Lock()
+_settings_cache = None
+_settings_mtime = 0
+
+# Serialized response body for /get_settings; the visualization polls that
+# endpoint far more often than the settings change, so the encode happens
+# only when the underlying snapshot does
+_settings_bytes = None
+_settings_bytes_mtime = -1
+
+
+def _load_settings_locked():
+    """(Re)load settings from disk if the file changed; caller holds the lock."""
+    global _settings_cache, _settings_mtime
+    try:
+        mtime = os.stat(_SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _settings_cache is None or mtime != _settings_mtime:
+        if mtime is not None:
+            with open(_SETTINGS_FILE, 'r') as f:
+                _settings_cache = json.load(f)
         else:
-            return data
+            # Deep copy so later merges never mutate the defaults
+            _settings_cache = json.loads(json.dumps(_DEFAULT_SETTINGS))
+        _settings_mtime = mtime
+    return _settings_cache
+
+
+def get_settings():
+    """Return the current settings dict."""
+    with _SETTINGS_LOCK:
+        return _load_settings_locked()
+
+
+def get_settings_bytes():
+    """Return the settings encoded for an HTTP response, cached per change."""
+    global _settings_bytes, _settings_bytes_mtime
+    with _SETTINGS_LOCK:
+        settings = _load_settings_locked()
+        if _settings_bytes is None or _settings_bytes_mtime != _settings_mtime:
+            _settings_bytes = _dumps(settings)
+            _settings_bytes_mtime = _settings_mtime
+        return _settings_bytes
+
+
+def update_settings(settings_update):
+    """Merge an update into the visualization settings and persist it.
+
+    No-op updates skip the disk entirely. Writes go to a tempfile in the
+    same directory followed by os.replace, so concurrent readers never
+    observe a half-written JSON document. Returns True when the file was
+    rewritten.
+    """
+    global _settings_mtime
+    with _SETTINGS_LOCK:
+        settings = _load_settings_locked()
+        visualization = settings.setdefault('visualization', {})
+        if all(key in visualization and visualization[key] == value
+               for key, value in settings_update.items()):
+            return False
+
+        visualization.update(settings_update)
+        tmp_path = _SETTINGS_FILE + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(settings, f, indent=4)
+        os.replace(tmp_path, _SETTINGS_FILE)
+        _settings_mtime = os.stat(_SETTINGS_FILE).st_mtime_ns
+        return True
+
+
+# Cache of the parsed battery log keyed on the file's stat signature. The
+# visualization polls /get_estimations far more often than the logger appends
+# a row, so most requests can skip the CSV parse entirely.
+_csv_cache = {'mtime': 0, 'size': 0, 'data': None}
+
+# The threaded server can run /get_estimations concurrently, but the CSV
+# cache, the shared DataFrame and the estimators' module-level interval
+# cache were all written for one request at a time; serialize the whole
+# computation
+_ESTIMATIONS_LOCK = threading.Lock()
+
+
+def load_battery_log(csv_file):
+    """Load the battery log CSV, reusing the parsed DataFrame if unchanged."""
+    st = os.stat(csv_file)
+    if (st.st_mtime_ns == _csv_cache['mtime'] and st.st_size == _csv_cache['size']
+            and _csv_cache['data'] is not None):
+        return _csv_cache['data']
+
+    # Parse timestamps during the CSV read so the column arrives typed and
+    # the estimators skip re-conversion. Empty fields and legacy "N/A"
+    # sentinels become NaN so the numeric columns stay typed instead of object
+    data = pd.read_csv(
+        csv_file, parse_dates=['timestamp'],
+        na_values=['N/A'],
+        dtype={'percentage': 'float32',
+               'voltage_v': 'float32',
+               'power_draw_w': 'float32',
+               'cycle_count': 'Int32'})
+
+    _csv_cache['mtime'] = st.st_mtime_ns
+    _csv_cache['size'] = st.st_size
+    _csv_cache['data'] = data
+    return data
+
+
+class SettingsHTTPServer(ThreadingHTTPServer):
+    """Threaded server so a slow client cannot block the settings polls."""
+
+    # Handler threads must not keep the process alive on shutdown
+    daemon_threads = True
+    # Allow immediate restart without waiting out TIME_WAIT
+    allow_reuse_address = True
+
+    def server_bind(self):
+        super().server_bind()
+        # Small JSON responses should go out immediately, not sit in
+        # Nagle's buffer; accepted sockets inherit the option on Linux
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+# Full response template for the JSON endpoints; status line, headers and
+# body go out in one write (wfile is unbuffered, so every send_header call
+# would otherwise be its own send() syscall)
+_JSON_RESPONSE = (b'HTTP/1.1 %d %b\r\n'
+                  b'Content-Type: application/json\r\n'
+                  b'Access-Control-Allow-Origin: *\r\n'
+                  b'Content-Length: %d\r\n'
+                  b'Connection: close\r\n'
+                  b'\r\n%b')
+
+
+class CombinedHandler(SimpleHTTPRequestHandler):
+    # Per-connection TCP_NODELAY for platforms where the listening-socket
+    # option does not propagate to accepted sockets
+    disable_nagle_algorithm = True
+
+    def send_json(self, status, body):
+        """Send a complete JSON response with a single socket write."""
+        self.log_request(status)
+        phrase = HTTPStatus(status).phrase.encode('ascii')
+        self.wfile.write(_JSON_RESPONSE % (status, phrase, len(body), body))
+        # The template promises Connection: close, so honor it
+        self.close_connection = True
 
     def do_POST(self):
         if self.path == '/update_settings':
@@ -33,36 +220,14 @@ class CombinedHandler(SimpleHTTPRequestHandler):
                 post_data = self.rfile.read(content_length)
                 settings_update = json.loads(post_data.decode('utf-8'))
 
-                # Normalize keys to snake_case
-                settings_update = self.normalize_keys(settings_update)
-
-                # Load current settings
-                settings_file = 'user_settings.json'
-                if os.path.exists(settings_file):
-                    with open(settings_file, 'r') as f:
-                        current_settings = json.load(f)
-                else:
-                    current_settings = {"logging": {"log_interval": 60}, "visualization": {}}
-
-                # Update visualization settings
-                current_settings['visualization'].update(settings_update)
-
-                # Save updated settings
-                with open(settings_file, 'w') as f:
-                    json.dump(current_settings, f, indent=4)
+                # Normalize keys to snake_case and merge into the shared
+                # settings; the disk is only touched when a value changed
+                update_settings(normalize_keys(settings_update))
 
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(b'{"status": "success"}')
+                self.send_json(200, b'{"status": "success"}')
 
             except Exception as e:
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": str(e)}).encode())
+                self.send_json(500, _dumps({"error": str(e)}))
         else:
             self.send_error(501, "Unsupported method ('POST')")
 
@@ -72,56 +237,27 @@ class CombinedHandler(SimpleHTTPRequestHandler):
                 self.path = '/battery_log_visualization.html'  # Default to the main HTML file
             if self.path == '/get_settings':
                 try:
-                    settings_file = 'user_settings.json'
-                    if os.path.exists(settings_file):
-                        with open(settings_file, 'r') as f:
-                            settings = json.load(f)
-                    else:
-                        settings = {"logging": {"log_interval": 60}, "visualization": {"time_range": "1h", "auto_refresh": True, "refresh_interval": 60000}}
-
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(settings).encode())
+                    self.send_json(200, get_settings_bytes())
 
                 except Exception as e:
-                    self.send_response(500)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({"error": str(e)}).encode())
+                    self.send_json(500, _dumps({"error": str(e)}))
             elif self.path == '/get_estimations':
                 try:
                     # Load battery data
                     csv_file = 'battery_log.csv'
                     if os.path.exists(csv_file):
-                        import pandas as pd
                         from battery_monitor.estimations import get_battery_estimations
+
+                        with _ESTIMATIONS_LOCK:
+                            data = load_battery_log(csv_file)
+                            estimations = get_battery_estimations(data)
                         
-                        data = pd.read_csv(csv_file)
-                        data['timestamp'] = pd.to_datetime(data['timestamp'])
-                        
-                        estimations = get_battery_estimations(data)
-                        
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps(estimations, default=str).encode())
+                        self.send_json(200, _dumps(estimations, default=str))
                     else:
-                        self.send_response(404)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({"error": "Battery log file not found"}).encode())
+                        self.send_json(404, _dumps({"error": "Battery log file not found"}))
                         
                 except Exception as e:
-                    self.send_response(500)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({"error": str(e)}).encode())
+                    self.send_json(500, _dumps({"error": str(e)}))
             else:
                 super().do_GET()
         except ConnectionAbortedError:
@@ -129,9 +265,6 @@ class CombinedHandler(SimpleHTTPRequestHandler):
 
 def run_settings_server():
     """Run a simple HTTP server for settings updates"""
-    import signal
-    import sys
-    
     server = None
     
     def signal_handler(signum, frame):
@@ -141,12 +274,14 @@ def run_settings_server():
             server.shutdown()
         sys.exit(0)
     
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Set up signal handlers (only possible from the main thread; when the
+    # server runs as a daemon thread the parent owns signal handling)
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
     
     try:
-        server = HTTPServer(('localhost', 8081), CombinedHandler)
+        server = SettingsHTTPServer(('localhost', 8081), CombinedHandler)
         print("Settings server running on http://localhost:8081")
         server.serve_forever()
     except KeyboardInterrupt: